@@ -4,6 +4,8 @@
 # dependencies = [
 #     "typer>=0.21.1",
 #     "rich>=14.0.0",
+#     "ijson>=3.2",
+#     "orjson>=3.9",
 # ]
 # ///
 
@@ -18,105 +20,429 @@ Usage:
     ssh-gh.py -H myserver          # Short form
 """
 
+import asyncio
+import functools
+import glob
+import http.client
+import itertools
 import json
+import mmap
+import os
+import platform
+import re
 import secrets
+import shlex
+import shutil
+import socket
 import subprocess
+import tempfile
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import IO, Annotated, Callable, Iterable, Iterator, Optional
 
 import typer
-from rich.console import Console
-from rich.prompt import Prompt
+
+try:
+    import ijson
+except ImportError:  # fall back to loading the whole status document
+    ijson = None
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# orjson.JSONDecodeError and json.JSONDecodeError are both ValueError subclasses
+JSON_ERRORS = (ValueError,) if ijson is None else (ValueError, ijson.JSONError)
 
 app = typer.Typer(
     help="SSH with GitHub Token - SSH into remote machine with gh token in environment",
     no_args_is_help=False,
 )
-console = Console()
+
+
+class _LazyConsole:
+    """Stand-in that builds the Rich console on first use, keeping rich off the import path"""
+
+    def __getattr__(self, name):
+        global console
+        from rich.console import Console
+
+        console = Console()
+        return getattr(console, name)
+
+
+console = _LazyConsole()
 
 # Prefix to identify Tailscale hosts in the selection list
 TAILSCALE_PREFIX = "[TS] "
 
+SYSTEM = platform.system()
+
+# Multiplex the interactive session and the token injector over one connection
+# (Windows OpenSSH has no ControlMaster support)
+SSH_MUX_OPTS = [] if SYSTEM == "Windows" else [
+    "-o", "ControlMaster=auto",
+    "-o", "ControlPath=~/.ssh/cm-%C",
+    "-o", "ControlPersist=30s",
+]
+
+# The token injector never prompts: it fails fast and retries instead of
+# competing with the interactive session for /dev/tty
+SSH_BATCH_OPTS = ["-o", "BatchMode=yes"]
+
+# How long the token injector waits for the interactive session to bring up
+# the ControlMaster before probing over connections of its own
+MASTER_READY_TIMEOUT = 3.0
+
+# How long the token injector waits for the remote FIFO to appear
+FIFO_READY_TIMEOUT = 10.0
+
+# Parsed ~/.ssh/config hosts, keyed by the stat of the config and its includes
+HOST_CACHE_PATH = Path.home() / ".cache" / "ssh-gh" / "hosts.json"
+
+# Only Host and Include lines matter for enumeration; the rest is never tokenized
+SSH_CONFIG_DIRECTIVE_RE = re.compile(rb"(?mi)^[ \t]*(Host|Include)(?:[ \t]*=[ \t]*|[ \t]+)(.+)$")
 
-def parse_ssh_config() -> list[str]:
+# Short-lived cache of normalized `tailscale status` nodes, shared with ts.py
+TAILSCALE_SOCKET = Path("/var/run/tailscale/tailscaled.sock")
+STATUS_CACHE_PATH = Path(os.environ.get("XDG_RUNTIME_DIR") or Path.home() / ".cache") / "tailscale-status.json"
+STATUS_CACHE_TTL = 10.0
+
+# Up to this many choices are handed to fzf in one write; above it a writer
+# thread streams them, and above FZF_TEMPFILE_THRESHOLD fzf reads a temp file
+FZF_STREAM_THRESHOLD = 1024
+FZF_TEMPFILE_THRESHOLD = 5000
+
+
+def _expand_include(pattern: str, ssh_dir: Path) -> list[Path]:
+    """Resolve an Include pattern the way ssh does (relative paths are under ~/.ssh)."""
+    pattern = os.path.expanduser(pattern)
+    if not os.path.isabs(pattern):
+        pattern = str(ssh_dir / pattern)
+    return [Path(p) for p in sorted(glob.glob(pattern))]
+
+
+def _ssh_config_stat_key(ssh_config_path: Path, include_patterns: list[str]) -> list[list]:
+    """Build the cache key: (path, mtime_ns, size) of the config and every included file."""
+    paths = [ssh_config_path]
+    for pattern in include_patterns:
+        paths.extend(_expand_include(pattern, ssh_config_path.parent))
+
+    key = []
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        key.append([str(path), st.st_mtime_ns, st.st_size])
+    return key
+
+
+def _scan_directives(path: Path) -> list[tuple[bytes, bytes]]:
+    """Return (keyword, arguments) of every Host/Include line, scanning an mmap of the file."""
+    with open(path, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return SSH_CONFIG_DIRECTIVE_RE.findall(data)
+        except (ValueError, OSError):
+            # Empty files (and some special files) cannot be mapped
+            return SSH_CONFIG_DIRECTIVE_RE.findall(f.read())
+
+
+def _read_ssh_config(path: Path, ssh_dir: Path, hosts: dict[str, None], include_patterns: list[str], seen: set[Path]):
+    """Collect Host aliases from one config file, following Include directives."""
+    if path in seen:
+        return
+    seen.add(path)
+
+    for keyword, args in _scan_directives(path):
+        try:
+            tokens = shlex.split(args.decode("utf-8", "replace"), comments=True)
+        except ValueError:
+            continue
+
+        if keyword.lower() == b"host":
+            # Skip wildcard patterns and negations; dict keys dedupe repeated aliases
+            for token in tokens:
+                if "*" not in token and "?" not in token and not token.startswith("!"):
+                    hosts[token] = None
+        else:
+            for pattern in tokens:
+                include_patterns.append(pattern)
+                for included in _expand_include(pattern, ssh_dir):
+                    if included.is_file():
+                        _read_ssh_config(included, ssh_dir, hosts, include_patterns, seen)
+
+
+def _load_host_cache(ssh_config_path: Path) -> list[str] | None:
+    """Return cached hosts if the config (and its includes) are unchanged since caching."""
+    try:
+        with open(HOST_CACHE_PATH, "r") as f:
+            cache = json.load(f)
+        if cache["key"] == _ssh_config_stat_key(ssh_config_path, cache["includes"]):
+            return cache["hosts"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _save_host_cache(stat_key: list[list], include_patterns: list[str], hosts: list[str]):
+    """Persist parsed hosts along with the stat key they were derived from."""
+    try:
+        HOST_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(HOST_CACHE_PATH, "w") as f:
+            json.dump({"key": stat_key, "includes": include_patterns, "hosts": hosts}, f)
+    except OSError:
+        pass
+
+
+def parse_ssh_config() -> tuple[list[str], list[str]]:
     """
     Parse ~/.ssh/config and extract Host entries
 
-    Returns: List of host names (excludes wildcards like *)
+    Results are cached in ~/.cache/ssh-gh/hosts.json and reused while the
+    config file (and any Include'd files) keep the same mtime and size.
+
+    Returns: (host names excluding wildcards like *, warning messages)
     """
     ssh_config_path = Path.home() / ".ssh" / "config"
 
     if not ssh_config_path.exists():
-        console.print("[yellow]Warning: ~/.ssh/config not found[/yellow]")
-        return []
+        return [], ["[yellow]Warning: ~/.ssh/config not found[/yellow]"]
+
+    cached = _load_host_cache(ssh_config_path)
+    if cached is not None:
+        return cached, []
 
-    hosts = []
+    hosts: dict[str, None] = {}
+    include_patterns = []
     try:
-        with open(ssh_config_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith("Host ") and not line.startswith("Host *"):
-                    host = line.split()[1]
-                    # Skip wildcards
-                    if "*" not in host:
-                        hosts.append(host)
+        _read_ssh_config(ssh_config_path, ssh_config_path.parent, hosts, include_patterns, set())
     except Exception as e:
-        console.print(f"[yellow]Warning: Failed to parse SSH config: {e}[/yellow]")
-        return []
-
-    return sorted(set(hosts))
-
-
-def find_tailscale_binary() -> str | None:
-    """Find the Tailscale binary path."""
-    candidates = [
-        "tailscale",
-        "tailscale.exe",
-        "/Applications/Tailscale.app/Contents/MacOS/Tailscale",
-        "/usr/bin/tailscale",
-        "/usr/local/bin/tailscale",
-    ]
-    for candidate in candidates:
+        return [], [f"[yellow]Warning: Failed to parse SSH config: {e}[/yellow]"]
+
+    sorted_hosts = sorted(hosts)
+    _save_host_cache(_ssh_config_stat_key(ssh_config_path, include_patterns), include_patterns, sorted_hosts)
+    return sorted_hosts, []
+
+
+@functools.cache
+def is_wsl() -> bool:
+    """Check if running inside WSL"""
+    if SYSTEM != "Linux":
+        return False
+    try:
+        with open("/proc/version", "r") as f:
+            return "microsoft" in f.read().lower()
+    except OSError:
+        return False
+
+
+@functools.cache
+def find_tailscale_binary(verify: bool = False) -> str | None:
+    """
+    Find the Tailscale binary path.
+
+    Resolution only checks PATH and known install locations; pass verify=True
+    to additionally run `tailscale version` on the hit.
+    """
+    candidate = shutil.which("tailscale") or shutil.which("tailscale.exe")
+    if not candidate:
+        for path in (
+            "/Applications/Tailscale.app/Contents/MacOS/Tailscale",
+            "/usr/bin/tailscale",
+            "/usr/local/bin/tailscale",
+        ):
+            if Path(path).is_file() and os.access(path, os.X_OK):
+                candidate = path
+                break
+
+    if candidate and verify:
         try:
-            subprocess.run([candidate, "version"], capture_output=True, check=True)
-            return candidate
-        except (subprocess.CalledProcessError, FileNotFoundError):
+            subprocess.run(
+                [candidate, "version"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=True,
+            )
+        except (subprocess.CalledProcessError, OSError):
+            return None
+    return candidate
+
+
+def _iter_status_nodes(stream: IO[bytes]) -> Iterator[tuple[bool, dict]]:
+    """
+    Yield (is_self, node) for Self and every Peer in `tailscale status --json`
+
+    With ijson the document is parsed incrementally, so only one node dict is
+    resident at a time; otherwise the whole document is loaded with json_loads.
+    """
+    if ijson is None:
+        data = json_loads(stream.read())
+        if data.get("Self"):
+            yield True, data["Self"]
+        for peer in data.get("Peer", {}).values():
+            yield False, peer
+        return
+
+    builder = None
+    root = ""
+    for prefix, event, value in ijson.parse(stream):
+        if builder is None:
+            if event == "start_map" and (
+                prefix == "Self" or (prefix.startswith("Peer.") and prefix.count(".") == 1)
+            ):
+                builder, root = ijson.ObjectBuilder(), prefix
+                builder.event(event, value)
             continue
-    return None
+
+        builder.event(event, value)
+        if event == "end_map" and prefix == root:
+            yield root == "Self", builder.value
+            builder = None
 
 
-def get_tailscale_hosts() -> list[str]:
-    """Get Tailscale hosts that have SSH enabled (sshHostKeys)."""
-    tailscale_bin = find_tailscale_binary()
-    if not tailscale_bin:
-        return []
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection to tailscaled's LocalAPI over its Unix socket"""
 
+    def __init__(self, socket_path: str):
+        super().__init__("local-tailscaled.sock")
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.socket_path)
+
+
+def _open_localapi_status() -> http.client.HTTPResponse | None:
+    """
+    Request /localapi/v0/status straight from tailscaled, skipping the CLI
+
+    Returns the streaming response, or None if the socket isn't reachable
+    (e.g. Windows or the macOS App Store build), so callers fall back to
+    `tailscale status --json`. WSL always falls back: the tailnet that
+    matters there is the Windows host's, not a Linux tailscaled's.
+    """
+    if is_wsl() or not hasattr(socket, "AF_UNIX") or not TAILSCALE_SOCKET.exists():
+        return None
+
+    connection = _UnixHTTPConnection(str(TAILSCALE_SOCKET))
     try:
-        result = subprocess.run(
-            [tailscale_bin, "status", "--json"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        data = json.loads(result.stdout)
-    except subprocess.CalledProcessError:
-        console.print("[yellow]Warning: Failed to get Tailscale status[/yellow]")
-        return []
-    except json.JSONDecodeError:
-        console.print("[yellow]Warning: Failed to parse Tailscale status JSON[/yellow]")
-        return []
+        connection.request("GET", "/localapi/v0/status")
+        response = connection.getresponse()
+    except OSError:
+        connection.close()
+        return None
+
+    if response.status != 200:
+        connection.close()
+        return None
+    return response
+
+
+def _status_nodes(stream: IO[bytes]) -> list[dict]:
+    """Normalize Self/Peer nodes of a status document into the shared cache format"""
+    nodes = []
+    for is_self, node in _iter_status_nodes(stream):
+        dns_name = node.get("DNSName", "").rstrip(".")
+        if dns_name:
+            nodes.append({
+                "name": node.get("HostName", ""),
+                "dns_name": dns_name,
+                "online": True if is_self else node.get("Online", False),
+                "is_self": is_self,
+                "ssh": bool(node.get("sshHostKeys")),  # note: lowercase 's'
+            })
+    return nodes
+
+
+def _cached_tailscale_status(
+    fetch: Callable[[], list[dict] | None], ttl: float = STATUS_CACHE_TTL
+) -> list[dict] | None:
+    """
+    Return Tailscale nodes from the status cache shared with ts.py
+
+    The cache is reused for `ttl` seconds while the tailscaled socket is
+    unchanged; otherwise `fetch` runs and its result is written atomically.
+    """
+    try:
+        socket_mtime = TAILSCALE_SOCKET.stat().st_mtime_ns
+    except OSError:
+        socket_mtime = None
 
-    hosts = []
-    for peer_info in data.get("Peer", {}).values():
-        ssh_keys = peer_info.get("sshHostKeys")  # note: lowercase 's'
-        if ssh_keys:
-            dns_name = peer_info.get("DNSName", "").rstrip(".")
-            if dns_name:
-                hosts.append(dns_name)
+    try:
+        if time.time() - STATUS_CACHE_PATH.stat().st_mtime < ttl:
+            cache = json_loads(STATUS_CACHE_PATH.read_bytes())
+            if cache["socket_mtime"] == socket_mtime:
+                return cache["nodes"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    nodes = fetch()
+    if nodes is not None:
+        try:
+            STATUS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = STATUS_CACHE_PATH.with_name(f"{STATUS_CACHE_PATH.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(json_dumps({"socket_mtime": socket_mtime, "nodes": nodes}))
+            os.replace(tmp_path, STATUS_CACHE_PATH)
+        except OSError:
+            pass
+    return nodes
 
-    return sorted(hosts)
+
+def get_tailscale_hosts(verify: bool = False) -> tuple[list[str], list[str]]:
+    """
+    Get Tailscale hosts that have SSH enabled (sshHostKeys).
+
+    Returns: (DNS names, warning messages)
+    """
+    warnings = []
+
+    def fetch() -> list[dict] | None:
+        response = _open_localapi_status()
+        if response is not None:
+            with response:
+                try:
+                    return _status_nodes(response)
+                except (*JSON_ERRORS, OSError, http.client.HTTPException):
+                    pass  # fall back to the CLI
+
+        tailscale_bin = find_tailscale_binary(verify)
+        if not tailscale_bin:
+            return None
+
+        nodes = []
+        parse_failed = False
+        with subprocess.Popen(
+            [tailscale_bin, "status", "--json"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        ) as process:
+            try:
+                nodes = _status_nodes(process.stdout)
+            except JSON_ERRORS:
+                parse_failed = True
+
+        if process.returncode != 0:
+            warnings.append("[yellow]Warning: Failed to get Tailscale status[/yellow]")
+            return None
+        if parse_failed:
+            warnings.append("[yellow]Warning: Failed to parse Tailscale status JSON[/yellow]")
+            return None
+        return nodes
+
+    nodes = _cached_tailscale_status(fetch) or []
+    hosts = [n["dns_name"] for n in nodes if n["ssh"] and not n["is_self"]]
+    return sorted(hosts), warnings
 
 
 def get_gh_token() -> str | None:
@@ -124,11 +450,12 @@ def get_gh_token() -> str | None:
     try:
         result = subprocess.run(
             ["gh", "auth", "token"],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             check=True
         )
-        return result.stdout.strip()
+        # Tokens are ASCII; skip the locale-codec text decode
+        return result.stdout.decode("ascii").strip()
     except subprocess.CalledProcessError:
         console.print("[red]Error: Failed to get gh token. Please run 'gh auth login' first.[/red]")
         return None
@@ -137,19 +464,76 @@ def get_gh_token() -> str | None:
         return None
 
 
-def fzf_select(choices: list[str], prompt: str = "") -> str | None:
+def _feed_choices(stdin: IO[bytes], choices: Iterable[str]):
+    """Write choices to fzf in 1024-line batches, flushing each so it can start ranking."""
+    remaining = iter(choices)
+    try:
+        while batch := list(itertools.islice(remaining, 1024)):
+            stdin.write(("\n".join(batch) + "\n").encode())
+            stdin.flush()
+        stdin.close()
+    except BrokenPipeError:
+        pass  # fzf exited before reading everything (selection made or cancelled)
+
+
+def _run_fzf_input(fzf_cmd: list[str], choices: Iterable[str]) -> tuple[int, str]:
+    """Run fzf on a short list passed as a single input buffer."""
+    result = subprocess.run(fzf_cmd, input="\n".join(choices).encode(), stdout=subprocess.PIPE)
+    return result.returncode, result.stdout.decode()
+
+
+def _run_fzf_piped(fzf_cmd: list[str], choices: Iterable[str]) -> tuple[int, str]:
+    """Run fzf, streaming choices from a writer thread so it can start ranking early."""
+    process = subprocess.Popen(
+        fzf_cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+    )
+
+    writer = threading.Thread(target=_feed_choices, args=(process.stdin, choices), daemon=True)
+    writer.start()
+    output = process.stdout.read().decode()
+    process.wait()
+    writer.join()
+    return process.returncode, output
+
+
+def _run_fzf_from_file(fzf_cmd: list[str], choices: Iterable[str]) -> tuple[int, str]:
+    """Run fzf with a temp file as stdin, letting it read large lists in big blocks."""
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        f.write("\n".join(choices))
+    try:
+        with open(f.name, "rb") as stdin:
+            result = subprocess.run(fzf_cmd, stdin=stdin, stdout=subprocess.PIPE)
+        return result.returncode, result.stdout.decode()
+    finally:
+        os.unlink(f.name)
+
+
+def fzf_select(
+    choices: Iterable[str],
+    prompt: str = "",
+    count: int | None = None,
+    skip_single: bool = True,
+) -> str | None:
     """
     Use fzf to select from a list of choices
 
     Args:
-        choices: List of choices to select from
+        choices: Choices to select from; consumed once, so a lazy iterable works
         prompt: Prompt message
+        count: Number of choices, required when choices has no len()
+        skip_single: Return a lone choice directly instead of launching fzf
 
     Returns:
         Selected choice or None if cancelled
     """
-    if not choices:
+    if count is None:
+        count = len(choices)
+    if not count:
         return None
+    if count == 1 and skip_single:
+        return next(iter(choices)).strip()
 
     # Build fzf command
     fzf_cmd = ["fzf", "--height=40%", "--layout=reverse", "--border", "--ansi"]
@@ -158,20 +542,15 @@ def fzf_select(choices: list[str], prompt: str = "") -> str | None:
         fzf_cmd.extend(["--header", prompt])
 
     try:
-        # Run fzf with choices as input
-        process = subprocess.Popen(
-            fzf_cmd,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-
-        # Send choices to fzf
-        output, error = process.communicate(input="\n".join(choices))
+        if count > FZF_TEMPFILE_THRESHOLD:
+            returncode, output = _run_fzf_from_file(fzf_cmd, choices)
+        elif count > FZF_STREAM_THRESHOLD:
+            returncode, output = _run_fzf_piped(fzf_cmd, choices)
+        else:
+            returncode, output = _run_fzf_input(fzf_cmd, choices)
 
         # Return selected choice (strip newline)
-        if process.returncode == 0 and output:
+        if returncode == 0 and output:
             return output.strip()
         return None
 
@@ -188,10 +567,86 @@ def fzf_select(choices: list[str], prompt: str = "") -> str | None:
 
 def prompt_username(default: str = "vscode") -> str:
     """Prompt user for SSH username with a default value."""
+    from rich.prompt import Prompt
+
     return Prompt.ask("[cyan]Enter SSH username[/cyan]", default=default)
 
 
-def ssh_with_gh_token(host: str, token: str | None, username: str | None = None):
+@functools.cache
+def ensure_ssh_dir():
+    """Create ~/.ssh if needed; without it ssh can't bind the ControlPath socket and no master comes up"""
+    if SSH_MUX_OPTS:
+        try:
+            (Path.home() / ".ssh").mkdir(mode=0o700, exist_ok=True)
+        except OSError:
+            pass
+
+
+async def _master_ready(ssh_target: str) -> bool:
+    """Check locally whether a ControlMaster for ssh_target is accepting connections"""
+    process = await asyncio.create_subprocess_exec(
+        "ssh", *SSH_MUX_OPTS, "-O", "check", ssh_target,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return await process.wait() == 0
+
+
+async def _inject_token(ssh_target: str, fifo_path: str, token: str):
+    """Wait for the remote FIFO, then write the token into it, over the session's ControlMaster when there is one."""
+    process = None
+    try:
+        # Give the interactive session a moment to bring up the master, checked
+        # locally so probes don't open connections of their own meanwhile
+        mux = False
+        deadline = time.monotonic() + MASTER_READY_TIMEOUT
+        while SSH_MUX_OPTS and time.monotonic() < deadline:
+            mux = await _master_ready(ssh_target)
+            if mux:
+                break
+            await asyncio.sleep(0.1)
+
+        # Poll for the FIFO with stepped backoff instead of a fixed sleep.
+        # Without a master, probes use batch-mode connections of their own
+        # until the session's master turns up (e.g. after a password prompt).
+        delay = 0.05
+        deadline = time.monotonic() + FIFO_READY_TIMEOUT
+        while True:
+            if SSH_MUX_OPTS and not mux:
+                mux = await _master_ready(ssh_target)
+            ssh_opts = [*SSH_MUX_OPTS, *SSH_BATCH_OPTS] if mux else SSH_BATCH_OPTS
+            process = await asyncio.create_subprocess_exec(
+                "ssh", *ssh_opts, ssh_target, f"test -p {fifo_path}",
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            if await process.wait() == 0:
+                break
+            if time.monotonic() >= deadline:
+                console.print("[red]Token injection failed: remote FIFO was not created in time[/red]")
+                return
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.2)
+
+        process = await asyncio.create_subprocess_exec(
+            "ssh", *ssh_opts, ssh_target, f"cat > {fifo_path}",
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        _, stderr = await process.communicate(token.encode())
+        if process.returncode != 0:
+            console.print(f"[red]Token injection failed: {stderr.decode(errors='replace').strip()}[/red]")
+    except Exception as e:
+        console.print(f"[red]Token injection failed: {e}[/red]")
+    finally:
+        if process is not None and process.returncode is None:
+            process.kill()
+
+
+async def ssh_with_gh_token(host: str, token: str | None, username: str | None = None):
     """SSH into host, optionally injecting GH_TOKEN via secure FIFO pipe."""
     ssh_target = f"{username}@{host}" if username else host
 
@@ -214,7 +669,7 @@ def ssh_with_gh_token(host: str, token: str | None, username: str | None = None)
     # Create FIFO, load token, set up git credential helper, then spawn shell
     remote_interactive_cmd = (
         f"rm -f {fifo_path} && "
-        f"mkfifo {fifo_path} && chmod 600 {fifo_path} && "
+        f"(umask 077 && mkfifo {fifo_path}) && "
         f"export MY_GH_TOKEN=$(cat {fifo_path}) && rm -f {fifo_path} && "
         f"export GIT_CONFIG_COUNT=1 && "
         f"export GIT_CONFIG_KEY_0='credential.helper' && "
@@ -224,29 +679,23 @@ def ssh_with_gh_token(host: str, token: str | None, username: str | None = None)
         f"exec ${{SHELL:-/bin/sh}} -l"
     )
 
-    def inject_token():
-        time.sleep(1.2)  # wait for FIFO creation
-        try:
-            subprocess.run(
-                ["ssh", ssh_target, f"cat > {fifo_path}"],
-                input=token,
-                text=True,
-                capture_output=True,
-                check=True
-            )
-        except Exception as e:
-            console.print(f"[red]Token injection failed: {e}[/red]")
-
-    threading.Thread(target=inject_token, daemon=True).start()
+    ensure_ssh_dir()
+    injector = asyncio.create_task(_inject_token(ssh_target, fifo_path, token))
+    loop = asyncio.get_running_loop()
 
     try:
-        subprocess.run(["ssh", "-t", ssh_target, remote_interactive_cmd])
+        await loop.run_in_executor(
+            None, subprocess.run, ["ssh", *SSH_MUX_OPTS, "-t", ssh_target, remote_interactive_cmd]
+        )
         console.print("[green]Session closed[/green]")
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         console.print("\n[yellow]Interrupted[/yellow]")
     except Exception as e:
         console.print(f"[red]Connection error: {e}[/red]")
     finally:
+        # Stop a still-pending injector so its ssh process doesn't outlive the session
+        injector.cancel()
+        await asyncio.gather(injector, return_exceptions=True)
         console.print("[cyan]Returned to local environment[/cyan]")
 
 
@@ -260,6 +709,10 @@ def main(
         bool,
         typer.Option("--plain", "-p", help="Plain SSH without GitHub token injection"),
     ] = False,
+    verify_tailscale: Annotated[
+        bool,
+        typer.Option("--verify-tailscale", help="Run 'tailscale version' to sanity-check the binary"),
+    ] = False,
 ):
     """SSH into a remote machine with GitHub token exported in the shell environment."""
     token = None
@@ -272,14 +725,19 @@ def main(
     is_tailscale_host = False
 
     if not host:
-        ssh_hosts = parse_ssh_config()
-        tailscale_hosts = get_tailscale_hosts()
-
-        all_hosts = []
-        all_hosts.extend(ssh_hosts)
-        all_hosts.extend(f"{TAILSCALE_PREFIX}{h}" for h in tailscale_hosts)
-
-        if not all_hosts:
+        # Both lookups are I/O-bound and independent; warnings are printed
+        # here so Rich output from the workers doesn't interleave
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            ssh_future = executor.submit(parse_ssh_config)
+            tailscale_future = executor.submit(get_tailscale_hosts, verify_tailscale)
+            ssh_hosts, ssh_warnings = ssh_future.result()
+            tailscale_hosts, tailscale_warnings = tailscale_future.result()
+
+        for warning in ssh_warnings + tailscale_warnings:
+            console.print(warning)
+
+        host_count = len(ssh_hosts) + len(tailscale_hosts)
+        if not host_count:
             console.print("[red]No hosts found in SSH config or Tailscale[/red]")
             raise typer.Exit(1)
 
@@ -288,7 +746,8 @@ def main(
         if tailscale_hosts:
             console.print(f"[blue]Found {len(tailscale_hosts)} Tailscale SSH hosts[/blue]")
 
-        selected = fzf_select(all_hosts, prompt="Select SSH host to connect")
+        choices = itertools.chain(ssh_hosts, (f"{TAILSCALE_PREFIX}{h}" for h in tailscale_hosts))
+        selected = fzf_select(choices, prompt="Select SSH host to connect", count=host_count)
 
         if not selected:
             console.print("[yellow]No host selected[/yellow]")
@@ -303,7 +762,7 @@ def main(
     if is_tailscale_host:
         username = prompt_username()
 
-    ssh_with_gh_token(host, token, username)
+    asyncio.run(ssh_with_gh_token(host, token, username))
 
 
 if __name__ == "__main__":
@@ -18,6 +18,7 @@ Usage:
     uv run ts-devcontainers.py --markdown   # Output as markdown table
 """
 
+import functools
 import json
 import os
 import platform
@@ -33,6 +34,7 @@ console = Console()
 DEVCONTAINER_TAG = "tag:devcontainer"
 
 
+@functools.cache
 def is_wsl() -> bool:
     if platform.system() != "Linux":
         return False
@@ -43,6 +45,7 @@ def is_wsl() -> bool:
         return False
 
 
+@functools.cache
 def get_tailscale_command() -> list[str]:
     system = platform.system()
 
@@ -4,6 +4,9 @@
 # dependencies = [
 #     "typer>=0.21.1",
 #     "rich>=13.7.0",
+#     "ijson>=3.2",
+#     "orjson>=3.9",
+#     "pyperclip>=1.8",
 # ]
 # ///
 
@@ -17,23 +20,110 @@ Usage:
     ts.py --filter keyword   # Filter machines
 """
 
+import functools
+import http.client
+import importlib.util
+import itertools
 import json
 import os
 import platform
+import shutil
+import socket
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import IO, Annotated, Callable, Iterator, Optional
 
 import typer
-from rich.console import Console
+
+try:
+    import ijson
+except ImportError:  # fall back to loading the whole status document
+    ijson = None
+
+try:
+    import pyperclip
+except ImportError:
+    pyperclip = None
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# orjson.JSONDecodeError and json.JSONDecodeError are both ValueError subclasses
+JSON_ERRORS = (ValueError,) if ijson is None else (ValueError, ijson.JSONError)
 
 app = typer.Typer(
     help="Tailscale Machine Selector - Copy machine DNS name to clipboard",
     no_args_is_help=False,
 )
 
-console = Console()
+
+class _LazyConsole:
+    """Stand-in that builds the Rich console on first use, keeping rich off the import path"""
+
+    def __getattr__(self, name):
+        return getattr(get_console(), name)
+
+
+console = _LazyConsole()
+_console_lock = threading.Lock()
+
+
+def get_console():
+    """Replace the lazy stand-in with the real Rich console, building it if needed"""
+    global console
+    # Locked so the main thread and the status worker can't each build one
+    with _console_lock:
+        if isinstance(console, _LazyConsole):
+            from rich.console import Console
+
+            console = Console()
+    return console
+
+
+SYSTEM = platform.system()
+
+# Clipboard tools per platform, tried in order (WSL uses clip.exe instead)
+CLIPBOARD_COMMANDS = {
+    "Darwin": [["pbcopy"]],
+    "Linux": [["xclip", "-selection", "clipboard"], ["xsel", "--clipboard", "--input"]],
+    "Windows": [["clip"]],
+}
+
+# Short-lived cache of normalized `tailscale status` nodes, shared with ssh-gh.py
+TAILSCALE_SOCKET = Path("/var/run/tailscale/tailscaled.sock")
+STATUS_CACHE_PATH = Path(os.environ.get("XDG_RUNTIME_DIR") or Path.home() / ".cache") / "tailscale-status.json"
+STATUS_CACHE_TTL = 10.0
+
+# Up to this many choices are handed to fzf in one write; above it a writer
+# thread streams them, and above FZF_TEMPFILE_THRESHOLD fzf reads a temp file
+FZF_STREAM_THRESHOLD = 1024
+FZF_TEMPFILE_THRESHOLD = 5000
+
+
+@dataclass(slots=True, frozen=True)
+class Machine:
+    """Tailscale machine as listed in the selector"""
+
+    name: str
+    dns_name: str
+    online: bool
+    is_self: bool
+    # Lowercased name/DNS joined by NUL so a filter is one substring search
+    search: str
 
 
 def is_interactive() -> bool:
@@ -41,9 +131,10 @@ def is_interactive() -> bool:
     return sys.stdin.isatty()
 
 
+@functools.cache
 def is_wsl() -> bool:
     """Check if running inside WSL"""
-    if platform.system() != "Linux":
+    if SYSTEM != "Linux":
         return False
     try:
         with open("/proc/version", "r") as f:
@@ -52,11 +143,18 @@ def is_wsl() -> bool:
         return False
 
 
+@functools.cache
 def get_tailscale_command() -> list[str]:
     """Get the appropriate tailscale command for current platform"""
-    system = platform.system()
+    if is_wsl():
+        return ["tailscale.exe"]
+
+    # PATH lookup first; the install-location probes below are only a fallback
+    found = shutil.which("tailscale")
+    if found:
+        return [found]
 
-    if system == "Windows":
+    if SYSTEM == "Windows":
         possible_paths = [
             Path(os.environ.get("ProgramFiles", "C:\\Program Files")) / "Tailscale" / "tailscale.exe",
             Path(os.environ.get("LOCALAPPDATA", "")) / "Tailscale" / "tailscale.exe",
@@ -68,98 +166,269 @@ def get_tailscale_command() -> list[str]:
                 return [str(path)]
         return ["tailscale"]
 
-    elif system == "Darwin":
+    elif SYSTEM == "Darwin":
         app_path = Path("/Applications/Tailscale.app/Contents/MacOS/Tailscale")
         if app_path.exists():
             return [str(app_path)]
         return ["tailscale"]
 
-    elif is_wsl():
-        return ["tailscale.exe"]
-
     else:
         return ["tailscale"]
 
 
-def run_tailscale_command(args: list[str]) -> subprocess.CompletedProcess:
-    """Run tailscale command, handling WSL specially"""
+def start_tailscale_command(args: list[str], stderr: IO[bytes]) -> subprocess.Popen:
+    """Start tailscale command with stdout piped for streaming, handling WSL specially"""
     if is_wsl():
-        return subprocess.run(
-            ["cmd.exe", "/c", "tailscale"] + args,
-            capture_output=True,
-            text=True,
+        cmd = ["cmd.exe", "/c", "tailscale"] + args
+    else:
+        cmd = get_tailscale_command() + args
+
+    return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr)
+
+
+def _iter_status_nodes(stream: IO[bytes]) -> Iterator[tuple[bool, dict]]:
+    """
+    Yield (is_self, node) for Self and every Peer in `tailscale status --json`
+
+    With ijson the document is parsed incrementally, so only one node dict is
+    resident at a time; otherwise the whole document is loaded with json_loads.
+    """
+    if ijson is None:
+        data = json_loads(stream.read())
+        if data.get("Self"):
+            yield True, data["Self"]
+        for peer in data.get("Peer", {}).values():
+            yield False, peer
+        return
+
+    builder = None
+    root = ""
+    for prefix, event, value in ijson.parse(stream):
+        if builder is None:
+            if event == "start_map" and (
+                prefix == "Self" or (prefix.startswith("Peer.") and prefix.count(".") == 1)
+            ):
+                builder, root = ijson.ObjectBuilder(), prefix
+                builder.event(event, value)
+            continue
+
+        builder.event(event, value)
+        if event == "end_map" and prefix == root:
+            yield root == "Self", builder.value
+            builder = None
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection to tailscaled's LocalAPI over its Unix socket"""
+
+    def __init__(self, socket_path: str):
+        super().__init__("local-tailscaled.sock")
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.socket_path)
+
+
+def _open_localapi_status() -> Optional[http.client.HTTPResponse]:
+    """
+    Request /localapi/v0/status straight from tailscaled, skipping the CLI
+
+    Returns the streaming response, or None if the socket isn't reachable
+    (e.g. Windows or the macOS App Store build), so callers fall back to
+    `tailscale status --json`. WSL always falls back: the tailnet that
+    matters there is the Windows host's, not a Linux tailscaled's.
+    """
+    if is_wsl() or not hasattr(socket, "AF_UNIX") or not TAILSCALE_SOCKET.exists():
+        return None
+
+    connection = _UnixHTTPConnection(str(TAILSCALE_SOCKET))
+    try:
+        connection.request("GET", "/localapi/v0/status")
+        response = connection.getresponse()
+    except OSError:
+        connection.close()
+        return None
+
+    if response.status != 200:
+        connection.close()
+        return None
+    return response
+
+
+def _status_nodes(stream: IO[bytes]) -> list[dict]:
+    """Normalize Self/Peer nodes of a status document into the shared cache format"""
+    nodes = []
+    for is_self, node in _iter_status_nodes(stream):
+        dns_name = node.get("DNSName", "").rstrip(".")
+        if dns_name:
+            nodes.append({
+                "name": node.get("HostName", ""),
+                "dns_name": dns_name,
+                "online": True if is_self else node.get("Online", False),
+                "is_self": is_self,
+                "ssh": bool(node.get("sshHostKeys")),  # note: lowercase 's'
+            })
+    return nodes
+
+
+def _fetch_tailscale_nodes() -> Optional[list[dict]]:
+    """Get normalized Self/Peer nodes from tailscaled or `tailscale status --json` (None on failure)"""
+    response = _open_localapi_status()
+    if response is not None:
+        with response:
+            try:
+                return _status_nodes(response)
+            except (*JSON_ERRORS, OSError, http.client.HTTPException):
+                pass  # fall back to the CLI
+
+    # stderr goes to a temp file so a chatty CLI can never block while we stream stdout
+    with tempfile.TemporaryFile() as stderr_file:
+        try:
+            process = start_tailscale_command(["status", "--json"], stderr_file)
+        except FileNotFoundError:
+            console.print("[red]Error: tailscale command not found[/red]")
+            if is_wsl():
+                console.print("[yellow]  WSL: Install Tailscale on Windows host[/yellow]")
+            elif SYSTEM == "Darwin":
+                console.print("[yellow]  macOS: brew install tailscale[/yellow]")
+            elif SYSTEM == "Windows":
+                console.print("[yellow]  Windows: https://tailscale.com/download/windows[/yellow]")
+            else:
+                console.print("[yellow]  Linux: https://tailscale.com/download/linux[/yellow]")
+            return None
+
+        nodes = []
+        parse_error = None
+
+        with process:
+            empty = not process.stdout.peek(1).strip()
+            if not empty:
+                try:
+                    nodes = _status_nodes(process.stdout)
+                except JSON_ERRORS as e:
+                    parse_error = e
+
+        stderr_file.seek(0)
+        stderr = stderr_file.read().decode(errors="replace")
+
+    if process.returncode != 0:
+        console.print("[red]Error: Failed to get Tailscale status[/red]")
+        console.print(f"[dim]{stderr}[/dim]")
+        return None
+
+    if empty:
+        console.print("[red]Error: Empty response from Tailscale[/red]")
+        return None
+
+    if parse_error:
+        console.print(f"[red]Error: Failed to parse Tailscale output: {parse_error}[/red]")
+        return None
+
+    return nodes
+
+
+def _cached_tailscale_status(
+    fetch: Callable[[], Optional[list[dict]]], ttl: float = STATUS_CACHE_TTL
+) -> Optional[list[dict]]:
+    """
+    Return Tailscale nodes from the status cache shared with ssh-gh.py
+
+    The cache is reused for `ttl` seconds while the tailscaled socket is
+    unchanged; otherwise `fetch` runs and its result is written atomically.
+    """
+    try:
+        socket_mtime = TAILSCALE_SOCKET.stat().st_mtime_ns
+    except OSError:
+        socket_mtime = None
+
+    try:
+        if time.time() - STATUS_CACHE_PATH.stat().st_mtime < ttl:
+            cache = json_loads(STATUS_CACHE_PATH.read_bytes())
+            if cache["socket_mtime"] == socket_mtime:
+                return cache["nodes"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    nodes = fetch()
+    if nodes is not None:
+        try:
+            STATUS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = STATUS_CACHE_PATH.with_name(f"{STATUS_CACHE_PATH.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(json_dumps({"socket_mtime": socket_mtime, "nodes": nodes}))
+            os.replace(tmp_path, STATUS_CACHE_PATH)
+        except OSError:
+            pass
+    return nodes
+
+
+def get_tailscale_machines() -> list[Machine]:
+    """Get list of Tailscale machines, reusing a status fetched in the last few seconds"""
+    nodes = _cached_tailscale_status(_fetch_tailscale_nodes) or []
+    return [
+        Machine(
+            name=node["name"],
+            dns_name=node["dns_name"],
+            online=node["online"],
+            is_self=node["is_self"],
+            search=f"{node['name']}\x00{node['dns_name']}".lower(),
         )
+        for node in nodes
+    ]
 
-    tailscale_cmd = get_tailscale_command()
-    return subprocess.run(
-        tailscale_cmd + args,
-        capture_output=True,
-        text=True,
+
+def _feed_choices(stdin: IO[bytes], choices: list[str]):
+    """Write choices to fzf in 1024-line batches, flushing each so it can start ranking."""
+    remaining = iter(choices)
+    try:
+        while batch := list(itertools.islice(remaining, 1024)):
+            stdin.write(("\n".join(batch) + "\n").encode())
+            stdin.flush()
+        stdin.close()
+    except BrokenPipeError:
+        pass  # fzf exited before reading everything (selection made or cancelled)
+
+
+def _run_fzf_input(fzf_cmd: list[str], choices: list[str]) -> tuple[int, str]:
+    """Run fzf on a short list passed as a single input buffer."""
+    result = subprocess.run(fzf_cmd, input="\n".join(choices).encode(), stdout=subprocess.PIPE)
+    return result.returncode, result.stdout.decode()
+
+
+def _run_fzf_piped(fzf_cmd: list[str], choices: list[str]) -> tuple[int, str]:
+    """Run fzf, streaming choices from a writer thread so it can start ranking early."""
+    process = subprocess.Popen(
+        fzf_cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
     )
 
+    writer = threading.Thread(target=_feed_choices, args=(process.stdin, choices), daemon=True)
+    writer.start()
+    output = process.stdout.read().decode()
+    process.wait()
+    writer.join()
+    return process.returncode, output
 
-def get_tailscale_machines() -> list[dict]:
-    """Get list of Tailscale machines using tailscale status --json"""
-    try:
-        result = run_tailscale_command(["status", "--json"])
-
-        if result.returncode != 0:
-            console.print("[red]Error: Failed to get Tailscale status[/red]")
-            console.print(f"[dim]{result.stderr}[/dim]")
-            return []
-
-        if not result.stdout.strip():
-            console.print("[red]Error: Empty response from Tailscale[/red]")
-            return []
-
-        data = json.loads(result.stdout)
-        peers = data.get("Peer", {})
-        self_node = data.get("Self", {})
-
-        machines = []
-
-        if self_node:
-            dns_name = self_node.get("DNSName", "").rstrip(".")
-            if dns_name:
-                machines.append({
-                    "name": self_node.get("HostName", ""),
-                    "dns_name": dns_name,
-                    "online": True,
-                    "is_self": True,
-                })
-
-        for peer_id, peer in peers.items():
-            dns_name = peer.get("DNSName", "").rstrip(".")
-            if dns_name:
-                machines.append({
-                    "name": peer.get("HostName", ""),
-                    "dns_name": dns_name,
-                    "online": peer.get("Online", False),
-                    "is_self": False,
-                })
-
-        return machines
 
-    except FileNotFoundError:
-        console.print("[red]Error: tailscale command not found[/red]")
-        if is_wsl():
-            console.print("[yellow]  WSL: Install Tailscale on Windows host[/yellow]")
-        elif platform.system() == "Darwin":
-            console.print("[yellow]  macOS: brew install tailscale[/yellow]")
-        elif platform.system() == "Windows":
-            console.print("[yellow]  Windows: https://tailscale.com/download/windows[/yellow]")
-        else:
-            console.print("[yellow]  Linux: https://tailscale.com/download/linux[/yellow]")
-        return []
-    except json.JSONDecodeError as e:
-        console.print(f"[red]Error: Failed to parse Tailscale output: {e}[/red]")
-        return []
+def _run_fzf_from_file(fzf_cmd: list[str], choices: list[str]) -> tuple[int, str]:
+    """Run fzf with a temp file as stdin, letting it read large lists in big blocks."""
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        f.write("\n".join(choices))
+    try:
+        with open(f.name, "rb") as stdin:
+            result = subprocess.run(fzf_cmd, stdin=stdin, stdout=subprocess.PIPE)
+        return result.returncode, result.stdout.decode()
+    finally:
+        os.unlink(f.name)
 
 
-def fzf_select(choices: list[str], prompt: str = "") -> Optional[str]:
-    """Use fzf to select from a list of choices"""
+def fzf_select(choices: list[str], prompt: str = "", skip_single: bool = True) -> Optional[str]:
+    """Use fzf to select from a list of choices; a lone choice is returned as-is unless skip_single is off"""
     if not choices:
         return None
+    if len(choices) == 1 and skip_single:
+        return choices[0].strip()
 
     fzf_cmd = ["fzf", "--height=60%", "--layout=reverse", "--border", "--ansi"]
 
@@ -167,17 +436,14 @@ def fzf_select(choices: list[str], prompt: str = "") -> Optional[str]:
         fzf_cmd.extend(["--header", prompt])
 
     try:
-        process = subprocess.Popen(
-            fzf_cmd,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-
-        output, error = process.communicate(input="\n".join(choices))
+        if len(choices) > FZF_TEMPFILE_THRESHOLD:
+            returncode, output = _run_fzf_from_file(fzf_cmd, choices)
+        elif len(choices) > FZF_STREAM_THRESHOLD:
+            returncode, output = _run_fzf_piped(fzf_cmd, choices)
+        else:
+            returncode, output = _run_fzf_input(fzf_cmd, choices)
 
-        if process.returncode == 0 and output:
+        if returncode == 0 and output:
             return output.strip()
         return None
 
@@ -192,40 +458,47 @@ def fzf_select(choices: list[str], prompt: str = "") -> Optional[str]:
         return None
 
 
+@functools.cache
+def pyperclip_copies_in_process() -> bool:
+    """
+    Check whether pyperclip copies without spawning a tool (Windows, or macOS with AppKit)
+
+    Elsewhere it runs xclip/xsel/pbcopy itself and ignores their exit status,
+    so a failed copy would look like a successful one.
+    """
+    if pyperclip is None:
+        return False
+    if SYSTEM == "Windows":
+        return True
+    return SYSTEM == "Darwin" and importlib.util.find_spec("AppKit") is not None
+
+
 def copy_to_clipboard(text: str) -> bool:
-    """Copy text to clipboard"""
-    system = platform.system()
+    """Copy text to clipboard, in-process via pyperclip where it can, else with a clipboard tool"""
+    if pyperclip_copies_in_process():
+        try:
+            pyperclip.copy(text)
+            return True
+        except pyperclip.PyperclipException:
+            pass  # no usable backend; fall back to the CLI tools below
+
+    commands = [["clip.exe"]] if is_wsl() else CLIPBOARD_COMMANDS.get(SYSTEM)
+    if not commands:
+        console.print(f"[yellow]Unsupported platform: {SYSTEM}[/yellow]")
+        return False
 
     try:
-        if system == "Darwin":
-            subprocess.run(["pbcopy"], input=text, text=True, check=True)
-        elif system == "Linux":
-            if is_wsl():
-                subprocess.run(["clip.exe"], input=text, text=True, check=True)
-            else:
-                try:
-                    subprocess.run(
-                        ["xclip", "-selection", "clipboard"],
-                        input=text,
-                        text=True,
-                        check=True,
-                    )
-                except FileNotFoundError:
-                    subprocess.run(
-                        ["xsel", "--clipboard", "--input"],
-                        input=text,
-                        text=True,
-                        check=True,
-                    )
-        elif system == "Windows":
-            subprocess.run(["clip"], input=text, text=True, check=True)
-        else:
-            console.print(f"[yellow]Unsupported platform: {system}[/yellow]")
-            return False
+        for cmd in commands[:-1]:
+            try:
+                subprocess.run(cmd, input=text, text=True, check=True)
+                return True
+            except FileNotFoundError:
+                continue  # try the next tool
+        subprocess.run(commands[-1], input=text, text=True, check=True)
         return True
     except FileNotFoundError:
         console.print("[red]Error: Clipboard tool not found[/red]")
-        if system == "Linux" and not is_wsl():
+        if SYSTEM == "Linux" and not is_wsl():
             console.print("[yellow]Install xclip: sudo apt install xclip[/yellow]")
         return False
     except subprocess.CalledProcessError as e:
@@ -249,31 +522,32 @@ def main(
         console.print("[red]Error: This tool requires an interactive terminal[/red]")
         raise typer.Exit(1)
 
-    machines = get_tailscale_machines()
+    # Fetch status in the background while the main thread pays for the Rich
+    # import that the output path needs anyway
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        machines_future = executor.submit(get_tailscale_machines)
+        get_console()
+        machines = machines_future.result()
 
     if not machines:
         console.print("[yellow]No Tailscale machines found[/yellow]")
         raise typer.Exit(1)
 
     if online_only:
-        machines = [m for m in machines if m["online"]]
+        machines = [m for m in machines if m.online]
 
     if filter_pattern:
-        machines = [
-            m for m in machines
-            if filter_pattern.lower() in m["name"].lower()
-            or filter_pattern.lower() in m["dns_name"].lower()
-        ]
+        pattern = filter_pattern.lower()
+        machines = [m for m in machines if pattern in m.search]
 
     if not machines:
         console.print("[yellow]No machines match the filter[/yellow]")
         raise typer.Exit(1)
 
-    choices = []
-    for m in machines:
-        status = "[+]" if m["online"] else "[-]"
-        self_marker = " (self)" if m.get("is_self") else ""
-        choices.append(f"{status} {m['dns_name']}{self_marker}")
+    choices = [
+        f"{'[+]' if m.online else '[-]'} {m.dns_name}{' (self)' if m.is_self else ''}"
+        for m in machines
+    ]
 
     selected = fzf_select(choices, prompt="Select Tailscale machine")
 
@@ -3,7 +3,7 @@
 # requires-python = ">=3.11"
 # dependencies = [
 #     "typer>=0.21.1",
-#     "rich>=13.7.0",
+#     "orjson>=3.9",
 # ]
 # ///
 
@@ -20,24 +20,36 @@ Usage:
     vsc.py --filter ca-expl             # Filter workspaces
     vsc.py --mode devcontainer          # Direct mode selection
     vsc.py --path /full/path            # Open specific path
+    vsc.py --no-cache                   # Refresh cached remote listings
 """
 
+from __future__ import annotations
+
+import functools
+import itertools
 import json
 import os
 import platform
+import re
+import shlex
+import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
 from enum import Enum
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import IO, Annotated, Optional
 
-import typer
-from rich.console import Console
+try:
+    import orjson
 
-app = typer.Typer(
-    help="VSCode Remote Access Tool - Open remote workspaces via SSH Remote or DevContainer",
-    no_args_is_help=False,
-)
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
 
 class Mode(str, Enum):
@@ -53,7 +65,82 @@ def is_interactive() -> bool:
     """Check if stdin is a terminal"""
     return sys.stdin.isatty()
 
-console = Console()
+
+SYSTEM = platform.system()
+
+# Status lines are single-color, so raw ANSI escapes stand in for Rich markup.
+# Windows Terminal enables VT processing; legacy consoles get plain text.
+USE_COLOR = (
+    sys.stdout.isatty()
+    and "NO_COLOR" not in os.environ
+    and (SYSTEM != "Windows" or "WT_SESSION" in os.environ)
+)
+ANSI_COLORS = {"red": "31", "green": "32", "yellow": "33", "cyan": "36", "dim": "2"}
+
+
+def cprint(message: str, color: str = ""):
+    """Print a status line, wrapped in the color's ANSI escape when stdout is a color terminal"""
+    if color and USE_COLOR:
+        message = f"\x1b[{ANSI_COLORS[color]}m{message}\x1b[0m"
+    print(message, flush=True)
+
+
+# Parsed ~/.ssh/config hosts, keyed by the config's (mtime_ns, size)
+HOST_CACHE_PATH = Path.home() / ".cache" / "vsc" / "ssh_hosts.json"
+
+# Share one SSH connection per host across ssh_exec calls, previews and the
+# terminal session (Windows OpenSSH has no ControlMaster support)
+SSH_MUX_OPTS = [] if SYSTEM == "Windows" else [
+    "-o", "ControlMaster=auto",
+    "-o", "ControlPath=~/.ssh/cm-%C",
+    "-o", "ControlPersist=60s",
+]
+
+# Resolved code.cmd location on Windows, revalidated with a single stat
+CODE_PATH_CACHE = Path.home() / ".cache" / "vsc" / "code_path.txt"
+
+# Remote directory/container listings are reused for this many seconds;
+# main() drops it to 0 for --no-cache
+LISTING_CACHE_DIR = Path.home() / ".cache" / "vsc"
+LISTING_CACHE_TTL = 5.0
+
+# Devcontainer presence per (host, path), recorded by list_remote_directories
+# and probe_remote
+DEVCONTAINER_FLAGS: dict[tuple[str, str], bool] = {}
+
+# Contents of .devcontainer/devcontainer.json and .devcontainer.json per
+# (host, path) as fetched by probe_remote; empty strings for missing files
+DEVCONTAINER_CONFIGS: dict[tuple[str, str], list[str]] = {}
+
+# Remote command output fetched ahead of time by probe_remote, keyed by
+# (host, command) and consulted by ssh_exec_cached before going to the host
+PREFETCHED_OUTPUT: dict[tuple[str, str], str] = {}
+
+# One JSON object per line keeps names/images with odd characters intact
+DOCKER_PS_ARGV = ["docker", "ps", "--format", "{{json .}}"]
+DOCKER_PS_CMD = shlex.join(DOCKER_PS_ARGV)
+
+# "workspaceFolder" key at the start of a line, so a //-commented one is
+# ignored; devcontainer.json is JSONC, which json.loads rejects
+WORKSPACE_FOLDER_RE = re.compile(r'(?m)^[ \t]*"workspaceFolder"[ \t]*:[ \t]*"([^"]+)"')
+
+# Hex-encoded into attached-container+<hex> URIs for the Dev Containers extension
+ATTACHED_CONTAINER_CONFIG = '{{"containerName":"/{name}"}}'
+
+# Section markers in probe_remote's combined output
+PROBE_SECTION_RE = re.compile(r"^=([A-Z_]+)=$")
+
+# Dependency/build directories that never contain workspaces; directory scans
+# don't descend into (or list) them
+PRUNE_DIRS = ("node_modules", ".venv", "target", "__pycache__")
+
+# Up to this many choices are handed to fzf in one write; above it a writer
+# thread streams them, and above FZF_TEMPFILE_THRESHOLD fzf reads a temp file
+FZF_STREAM_THRESHOLD = 1024
+FZF_TEMPFILE_THRESHOLD = 5000
+
+# "Host alias..." lines; captures the aliases without any trailing comment
+HOST_RE = re.compile(rb"(?mi)^[ \t]*Host(?:[ \t]*=[ \t]*|[ \t]+)(.+?)[ \t]*(?:#.*)?$")
 
 
 def is_local_host(host: str) -> bool:
@@ -61,35 +148,76 @@ def is_local_host(host: str) -> bool:
     return host in ("local", "localhost", "127.0.0.1", "")
 
 
+def _load_host_cache(stat_key: list[int]) -> Optional[list[str]]:
+    """Return cached hosts if they were parsed from a config with the same stat key"""
+    try:
+        cache = json.loads(HOST_CACHE_PATH.read_text())
+        if cache["key"] == stat_key:
+            return cache["hosts"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _save_host_cache(stat_key: list[int], hosts: list[str]):
+    """Persist parsed hosts along with the stat key they were derived from"""
+    try:
+        HOST_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so a concurrent run never reads a half-written cache
+        tmp_path = HOST_CACHE_PATH.with_name(f"{HOST_CACHE_PATH.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({"key": stat_key, "hosts": hosts}))
+        os.replace(tmp_path, HOST_CACHE_PATH)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=1)
 def parse_ssh_config() -> list[str]:
     """
     Parse ~/.ssh/config and extract Host entries
 
+    The result is cached in ~/.cache/vsc/ssh_hosts.json and reused while the
+    config's mtime and size are unchanged.
+
     Returns: List of host names (excludes wildcards like *)
     """
     ssh_config_path = Path.home() / ".ssh" / "config"
 
-    if not ssh_config_path.exists():
+    try:
+        st = ssh_config_path.stat()
+    except OSError:
         return []
 
-    hosts = []
+    stat_key = [st.st_mtime_ns, st.st_size]
+    cached = _load_host_cache(stat_key)
+    if cached is not None:
+        return cached
+
+    hosts = set()
     try:
-        with open(ssh_config_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                # Match "Host hostname" lines, ignore wildcards
-                if line.startswith("Host ") and not line.startswith("Host *"):
-                    # Extract host name(s) after "Host"
-                    parts = line.split()[1:]
-                    for host in parts:
-                        # Skip wildcard patterns
-                        if "*" not in host and "?" not in host:
-                            hosts.append(host)
+        # One C-level regex scan over the raw bytes instead of a Python line loop
+        for match in HOST_RE.finditer(ssh_config_path.read_bytes()):
+            for host in match.group(1).split():
+                # Skip wildcard and negated patterns
+                if b"*" not in host and b"?" not in host and not host.startswith(b"!"):
+                    hosts.add(host.decode("utf-8", "replace"))
     except Exception as e:
-        console.print(f"[yellow]Warning: Failed to parse SSH config: {e}[/yellow]")
+        cprint(f"Warning: Failed to parse SSH config: {e}", "yellow")
         return []
 
-    return sorted(set(hosts))
+    hosts = sorted(hosts)
+    _save_host_cache(stat_key, hosts)
+    return hosts
+
+
+@functools.cache
+def ensure_ssh_dir():
+    """Create ~/.ssh if needed; without it ssh can't bind the ControlPath socket and every call goes unshared"""
+    if SSH_MUX_OPTS:
+        try:
+            (Path.home() / ".ssh").mkdir(mode=0o700, exist_ok=True)
+        except OSError:
+            pass
 
 
 def ssh_exec(host: str, command: str) -> tuple[str, int]:
@@ -98,47 +226,197 @@ def ssh_exec(host: str, command: str) -> tuple[str, int]:
 
     Returns: (stdout, exit_code)
     """
-    result = subprocess.run(["ssh", host, command], capture_output=True, text=True)
+    ensure_ssh_dir()
+    # No stdin: probes can run while fzf is reading the terminal
+    result = subprocess.run(
+        ["ssh", *SSH_MUX_OPTS, host, command], stdin=subprocess.DEVNULL, capture_output=True, text=True
+    )
     return result.stdout, result.returncode
 
 
-def list_local_directories(base_path: str, maxdepth: int = 1, git_only: bool = False) -> list[str]:
-    """List directories on local machine, optionally filter for .git directories"""
-    if git_only:
-        cmd = f"find '{base_path}' -maxdepth {maxdepth} -type d -name .git 2>/dev/null | sed 's|/.git$||' | sort"
-    else:
-        cmd = f"find '{base_path}' -maxdepth {maxdepth} -type d 2>/dev/null | sort"
+def ssh_exec_argv(host: str, argv: list[str]) -> tuple[str, int]:
+    """
+    Execute argv on remote host via SSH
+
+    ssh joins its arguments into one string for the remote shell, so each
+    element is quoted with shlex.join rather than interpolated.
 
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+    Returns: (stdout, exit_code)
+    """
+    return ssh_exec(host, shlex.join(argv))
+
+
+def _listing_cache_path(host: str, kind: str) -> Path:
+    """Cache file for a host's listing, e.g. ~/.cache/vsc/<host>-dirs.json"""
+    safe_host = re.sub(r"[^\w.-]", "_", host)
+    return LISTING_CACHE_DIR / f"{safe_host}-{kind}.json"
+
+
+def ssh_exec_cached(host: str, command: str, kind: str) -> tuple[str, int]:
+    """
+    ssh_exec() whose successful output is reused for LISTING_CACHE_TTL seconds
 
-    if result.returncode != 0:
+    The cache entry is tied to the exact command, so a different base path,
+    depth or filter always goes back to the host.
+    """
+    if (host, command) in PREFETCHED_OUTPUT:
+        return PREFETCHED_OUTPUT[(host, command)], 0
+
+    cache_path = _listing_cache_path(host, kind)
+    try:
+        cache = json.loads(cache_path.read_text())
+        if cache["command"] == command and time.time() - cache["ts"] < LISTING_CACHE_TTL:
+            return cache["stdout"], 0
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    stdout, exit_code = ssh_exec(host, command)
+    if exit_code == 0:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps({"ts": time.time(), "command": command, "stdout": stdout}))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+    return stdout, exit_code
+
+
+def _scan(base_path: str, maxdepth: int, git_only: bool) -> list[str]:
+    """
+    Breadth-first walk equivalent to `find base -maxdepth N -type d`
+
+    With git_only, yields the parents of .git directories instead (what the
+    old `-name .git | sed 's|/.git$||'` pipeline produced).
+    """
+    if not os.path.isdir(base_path):
         return []
 
-    return [line.strip() for line in result.stdout.splitlines() if line.strip()]
+    results = [] if git_only else [base_path]
+    queue = deque([(base_path, 0)])
+    while queue:
+        path, depth = queue.popleft()
+        if depth >= maxdepth:
+            continue
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.name in PRUNE_DIRS or not entry.is_dir(follow_symlinks=False):
+                        continue
+                    if git_only:
+                        if entry.name == ".git":
+                            results.append(path)
+                            continue  # nothing to find inside a .git directory
+                    else:
+                        results.append(entry.path)
+                    queue.append((entry.path, depth + 1))
+        except OSError:
+            continue  # unreadable directory, same as find's 2>/dev/null
+
+    return sorted(results)
+
 
+def list_local_directories(base_path: str, maxdepth: int = 1, git_only: bool = False) -> list[str]:
+    """List directories on local machine, optionally filter for .git directories"""
+    return _scan(base_path, maxdepth, git_only)
+
+
+def _remote_listing_cmd(base_path_expr: str, maxdepth: int, git_only: bool, filter_pattern: str = "") -> str:
+    """
+    Build the remote directory listing pipeline; base_path_expr is spliced in as shell syntax
 
-def list_remote_directories(host: str, base_path: str, maxdepth: int = 1, git_only: bool = False) -> list[str]:
-    """List directories on remote host, optionally filter for .git directories"""
+    fd (or Debian's fdfind) is used when the host has it, falling back to find.
+    Both skip PRUNE_DIRS, and trailing slashes from fd are stripped so the
+    output is identical either way. A filter_pattern is applied remotely as a
+    case-insensitive substring match, so only matches cross the connection.
+    """
+    prune = " -o ".join(f"-name {name}" for name in PRUNE_DIRS)
+    find = f"find {base_path_expr} -maxdepth {maxdepth} \\( {prune} \\) -prune -o"
+    excludes = " ".join(f"--exclude {name}" for name in PRUNE_DIRS)
+    fd = f'"$FD" --hidden --no-ignore --type d --max-depth {maxdepth} {excludes}'
     if git_only:
-        # Find directories containing .git subdirectory
-        cmd = f"find '{base_path}' -maxdepth {maxdepth} -type d -name .git 2>/dev/null | sed 's|/.git$||' | sort"
+        # Find directories containing .git subdirectory, without descending into .git itself
+        fd_cmd = f"{fd} '^\\.git$' {base_path_expr} 2>/dev/null | sed 's|/$||; s|/.git$||'"
+        find_cmd = f"{find} -type d -name .git -prune -print 2>/dev/null | sed 's|/.git$||'"
     else:
-        cmd = f"find '{base_path}' -maxdepth {maxdepth} -type d 2>/dev/null | sort"
+        # find lists the base itself (when it exists), fd doesn't
+        fd_cmd = (
+            f"{{ [ -d {base_path_expr} ] && printf '%s\\n' {base_path_expr}; {fd} . {base_path_expr} 2>/dev/null; }}"
+            " | sed 's|/$||'"
+        )
+        find_cmd = f"{find} -type d -print 2>/dev/null"
+    cmd = (
+        "FD=$(command -v fd || command -v fdfind); "
+        f'if [ -n "$FD" ]; then {fd_cmd}; else {find_cmd}; fi'
+    )
+    if filter_pattern:
+        cmd += f" | grep -i -F -- {shlex.quote(filter_pattern)}"
+    cmd += " | sort"
+
+    # Emit "1|0<TAB>path" per directory, 1 when it has a devcontainer config. The
+    # flag goes first so fzf can hide it with --with-nth when streaming.
+    return cmd + (
+        " | while IFS= read -r p; do"
+        " if [ -d \"$p/.devcontainer\" ] || [ -f \"$p/.devcontainer.json\" ]; then dc=1; else dc=0; fi;"
+        " printf '%s\\t%s\\n' \"$dc\" \"$p\";"
+        " done"
+    )
 
-    stdout, exit_code = ssh_exec(host, cmd)
+
+def _parse_remote_listing(host: str, output: str) -> list[str]:
+    """Parse "1|0<TAB>path" lines, recording devcontainer flags along the way"""
+    dirs = []
+    for line in output.splitlines():
+        dc, _, path = line.partition("\t")
+        if path:
+            dirs.append(path)
+            DEVCONTAINER_FLAGS[(host, path)] = dc == "1"
+    return dirs
+
+
+def list_remote_directories(
+    host: str, base_path: str, maxdepth: int = 1, git_only: bool = False, filter_pattern: str = ""
+) -> list[str]:
+    """
+    List directories on remote host, optionally filter for .git directories
+
+    Devcontainer presence is probed in the same SSH round-trip and recorded
+    so has_devcontainer() and the fzf preview don't need another connection.
+    """
+    stdout, exit_code = ssh_exec_cached(host, _remote_listing_cmd(shlex.quote(base_path), maxdepth, git_only, filter_pattern), "dirs")
 
     if exit_code != 0:
         return []
 
-    return [line.strip() for line in stdout.splitlines() if line.strip()]
+    return _parse_remote_listing(host, stdout)
+
+
+def list_remote_home_workspaces(
+    host: str, maxdepth: int = 1, git_only: bool = False, filter_pattern: str = ""
+) -> Optional[tuple[str, list[str]]]:
+    """
+    Detect the remote $HOME and list $HOME/workspaces in a single SSH round-trip
+
+    Returns: (base_path, dirs), or None if the home directory couldn't be determined
+    """
+    cmd = 'echo "$HOME"; ' + _remote_listing_cmd('"$HOME/workspaces"', maxdepth, git_only, filter_pattern)
+    stdout, exit_code = ssh_exec_cached(host, cmd, "dirs")
+
+    home, _, listing = stdout.partition("\n")
+    if exit_code != 0 or not home.strip():
+        return None
+
+    return f"{home.strip()}/workspaces", _parse_remote_listing(host, listing)
 
 
-def list_directories(host: str, base_path: str, maxdepth: int = 1, git_only: bool = False) -> list[str]:
+def list_directories(
+    host: str, base_path: str, maxdepth: int = 1, git_only: bool = False, filter_pattern: str = ""
+) -> list[str]:
     """List directories on local or remote host"""
     if is_local_host(host):
         return list_local_directories(base_path, maxdepth, git_only)
     else:
-        return list_remote_directories(host, base_path, maxdepth, git_only)
+        return list_remote_directories(host, base_path, maxdepth, git_only, filter_pattern)
 
 
 def has_devcontainer(host: str, path: str) -> bool:
@@ -147,10 +425,76 @@ def has_devcontainer(host: str, path: str) -> bool:
         devcontainer_dir = Path(path) / ".devcontainer"
         devcontainer_json = Path(path) / ".devcontainer.json"
         return devcontainer_dir.exists() or devcontainer_json.exists()
+    elif (host, path) in DEVCONTAINER_FLAGS:
+        return DEVCONTAINER_FLAGS[(host, path)]
     else:
-        cmd = f"[ -d '{path}/.devcontainer' ] || [ -f '{path}/.devcontainer.json' ] && echo 'yes' || echo 'no'"
-        stdout, _ = ssh_exec(host, cmd)
-        return stdout.strip() == "yes"
+        _, exit_code = ssh_exec_argv(
+            host, ["test", "-d", f"{path}/.devcontainer", "-o", "-f", f"{path}/.devcontainer.json"]
+        )
+        return exit_code == 0
+
+
+def probe_remote(host: str, workspace_path: str) -> dict[str, str]:
+    """
+    Fetch everything the mode step needs for a remote workspace in one SSH call
+
+    Devcontainer presence, both devcontainer config files and the running
+    containers come back as "=SECTION=" delimited output. They're recorded in
+    DEVCONTAINER_FLAGS, DEVCONTAINER_CONFIGS and PREFETCHED_OUTPUT so
+    has_devcontainer(), get_workspace_folder() and list_containers() don't
+    reconnect.
+
+    Returns: Section name -> raw section text (empty dict if ssh failed)
+    """
+    cmd = (
+        f"p={shlex.quote(workspace_path)}; "
+        "echo =DC=; "
+        'if [ -d "$p/.devcontainer" ] || [ -f "$p/.devcontainer.json" ]; then echo 1; else echo 0; fi; '
+        # Trailing echo keeps the next marker on its own line when a file lacks a final newline
+        'echo =DC_JSON=; cat "$p/.devcontainer/devcontainer.json" 2>/dev/null; echo; '
+        'echo =DC_JSON_ROOT=; cat "$p/.devcontainer.json" 2>/dev/null; echo; '
+        f"echo =CONTAINERS=; {DOCKER_PS_CMD} 2>/dev/null"
+    )
+    stdout, exit_code = ssh_exec(host, cmd)
+    if exit_code != 0 and not stdout:
+        return {}
+
+    sections: dict[str, list[str]] = {}
+    current = None
+    for line in stdout.splitlines(keepends=True):
+        match = PROBE_SECTION_RE.match(line.rstrip("\n"))
+        if match:
+            current = sections.setdefault(match.group(1), [])
+        elif current is not None:
+            current.append(line)
+    probe = {name: "".join(lines) for name, lines in sections.items()}
+
+    key = (host, workspace_path)
+    if "DC" in probe:
+        DEVCONTAINER_FLAGS[key] = probe["DC"].strip() == "1"
+    DEVCONTAINER_CONFIGS[key] = [probe.get("DC_JSON", "").strip(), probe.get("DC_JSON_ROOT", "").strip()]
+    if "CONTAINERS" in probe:
+        PREFETCHED_OUTPUT[(host, DOCKER_PS_CMD)] = probe["CONTAINERS"]
+    return probe
+
+
+def probe_remote_in_background(host: str, workspace_path: str) -> Future:
+    """
+    Run probe_remote() on a daemon thread
+
+    Modes that never need the probe (ssh) exit without waiting for it, which
+    a ThreadPoolExecutor worker wouldn't allow.
+    """
+    future: Future = Future()
+
+    def run():
+        try:
+            future.set_result(probe_remote(host, workspace_path))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
 
 
 def get_workspace_folder(host: str, workspace_path: str, workspace_name: str) -> str:
@@ -162,71 +506,151 @@ def get_workspace_folder(host: str, workspace_path: str, workspace_name: str) ->
         f"{workspace_path}/.devcontainer.json",
     ]
 
-    for config_file in config_files:
+    prefetched = DEVCONTAINER_CONFIGS.get((host, workspace_path))
+
+    for i, config_file in enumerate(config_files):
         config_content = None
 
-        if is_local_host(host):
+        if prefetched is not None:
+            config_content = prefetched[i]
+        elif is_local_host(host):
             config_path = Path(config_file)
             if config_path.exists():
                 config_content = config_path.read_text()
         else:
-            cmd = f"cat '{config_file}' 2>/dev/null"
-            stdout, exit_code = ssh_exec(host, cmd)
+            stdout, exit_code = ssh_exec_argv(host, ["cat", "--", config_file])
             if exit_code == 0 and stdout.strip():
                 config_content = stdout
 
         if config_content:
-            try:
-                config = json.loads(config_content)
-                if "workspaceFolder" in config:
-                    folder = config["workspaceFolder"]
-                    folder = folder.replace("${localWorkspaceFolderBasename}", workspace_name)
-                    console.print(f"[dim]Using workspaceFolder from config: {folder}[/dim]")
-                    return folder
-            except json.JSONDecodeError:
-                continue
+            match = WORKSPACE_FOLDER_RE.search(config_content)
+            if match:
+                folder = match.group(1)
+            else:
+                # Compact single-line JSON doesn't put the key at a line start
+                try:
+                    folder = json.loads(config_content).get("workspaceFolder")
+                except (json.JSONDecodeError, AttributeError):
+                    continue
+            if folder:
+                folder = folder.replace("${localWorkspaceFolderBasename}", workspace_name)
+                cprint(f"Using workspaceFolder from config: {folder}", "dim")
+                return folder
 
     return default_path
 
 
 def list_containers(host: str, filter_pattern: str = "") -> list[dict]:
     """List running Docker containers"""
-    cmd = "docker ps --format '{{.ID}}\t{{.Names}}\t{{.Image}}'"
-
     if is_local_host(host):
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        try:
+            result = subprocess.run(DOCKER_PS_ARGV, capture_output=True, text=True)
+        except FileNotFoundError:
+            return []
         stdout = result.stdout
         exit_code = result.returncode
     else:
-        stdout, exit_code = ssh_exec(host, cmd)
+        stdout, exit_code = ssh_exec_cached(host, DOCKER_PS_CMD, "containers")
 
     if exit_code != 0:
         return []
 
+    pattern = filter_pattern.lower()
     containers = []
-    for line in stdout.splitlines():
-        if not line.strip():
+    # docker emits exactly one compact object per "\n"-terminated line, so no strip needed
+    for line in stdout.split("\n"):
+        if not line:
             continue
 
-        parts = line.strip().split("\t")
-        if len(parts) >= 3:
-            container_id, name, image = parts[0], parts[1], parts[2]
-            if (
-                not filter_pattern
-                or filter_pattern.lower() in image.lower()
-                or filter_pattern.lower() in name.lower()
-            ):
-                containers.append({"id": container_id, "name": name, "image": image})
+        try:
+            row = json_loads(line)
+            container_id, name, image = row["ID"], row["Names"], row["Image"]
+        except (ValueError, KeyError, TypeError):
+            continue
+        # One lowercased haystack per row, NUL-joined so a match can't span both fields
+        if not pattern or pattern in f"{name}\x00{image}".lower():
+            containers.append({"id": container_id, "name": name, "image": image})
 
     return containers
 
 
+def _feed_choices(stdin: IO[bytes], choices: list[str]):
+    """Write choices to fzf in 1024-line batches, flushing each so it can start ranking."""
+    remaining = iter(choices)
+    try:
+        while batch := list(itertools.islice(remaining, 1024)):
+            stdin.write(("\n".join(batch) + "\n").encode())
+            stdin.flush()
+        stdin.close()
+    except BrokenPipeError:
+        pass  # fzf exited before reading everything (selection made or cancelled)
+
+
+def _run_fzf_input(fzf_cmd: list[str], choices: list[str]) -> tuple[int, str]:
+    """Run fzf on a short list passed as a single input buffer."""
+    result = subprocess.run(fzf_cmd, input="\n".join(choices).encode(), stdout=subprocess.PIPE)
+    return result.returncode, result.stdout.decode()
+
+
+def _run_fzf_piped(fzf_cmd: list[str], choices: list[str]) -> tuple[int, str]:
+    """Run fzf, streaming choices from a writer thread so it can start ranking early."""
+    process = subprocess.Popen(
+        fzf_cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+    )
+
+    writer = threading.Thread(target=_feed_choices, args=(process.stdin, choices), daemon=True)
+    writer.start()
+    output = process.stdout.read().decode()
+    process.wait()
+    writer.join()
+    return process.returncode, output
+
+
+def _run_fzf_from_file(fzf_cmd: list[str], choices: list[str]) -> tuple[int, str]:
+    """Run fzf with a temp file as stdin, letting it read large lists in big blocks."""
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        f.write("\n".join(choices))
+    try:
+        with open(f.name, "rb") as stdin:
+            result = subprocess.run(fzf_cmd, stdin=stdin, stdout=subprocess.PIPE)
+        return result.returncode, result.stdout.decode()
+    finally:
+        os.unlink(f.name)
+
+
+def _fzf_command(prompt: str, preview: Optional[str], preview_window: str, delimiter: Optional[str]) -> list[str]:
+    """Build the fzf argv shared by fzf_select and fzf_select_stream"""
+    fzf_cmd = ["fzf", "--height=60%", "--layout=reverse", "--border", "--ansi"]
+
+    if prompt:
+        fzf_cmd.extend(["--header", prompt])
+
+    # If delimiter is specified, show only specific fields
+    if delimiter:
+        fzf_cmd.extend(["--delimiter", delimiter, "--with-nth", "2.."])
+
+    if preview:
+        fzf_cmd.extend(["--preview", preview, "--preview-window", preview_window])
+
+    return fzf_cmd
+
+
+def _print_fzf_missing():
+    cprint("Error: fzf not found. Please install fzf first.", "red")
+    cprint("  macOS: brew install fzf", "yellow")
+    cprint("  Linux: sudo apt install fzf", "yellow")
+    cprint("  Windows: scoop install fzf", "yellow")
+
+
 def fzf_select(
     choices: list[str],
     prompt: str = "",
     preview: Optional[str] = None,
     preview_window: str = "down:40%",
     delimiter: Optional[str] = None,
+    skip_single: bool = True,
 ) -> Optional[str]:
     """
     Use fzf to select from a list of choices
@@ -237,81 +661,150 @@ def fzf_select(
         preview: Preview command (can use {} as placeholder for selection)
         preview_window: Preview window configuration
         delimiter: Field delimiter (e.g., '\t' for tab-separated values)
+        skip_single: Return a lone choice directly instead of launching fzf
 
     Returns:
         Selected choice or None if cancelled
     """
     if not choices:
         return None
+    if len(choices) == 1 and skip_single:
+        return choices[0].strip()
 
-    # Build fzf command
-    fzf_cmd = ["fzf", "--height=60%", "--layout=reverse", "--border", "--ansi"]
-
-    if prompt:
-        fzf_cmd.extend(["--header", prompt])
-
-    # If delimiter is specified, show only specific fields
-    if delimiter:
-        fzf_cmd.extend(["--delimiter", delimiter, "--with-nth", "2.."])
-
-    if preview:
-        fzf_cmd.extend(["--preview", preview, "--preview-window", preview_window])
+    fzf_cmd = _fzf_command(prompt, preview, preview_window, delimiter)
 
     try:
-        # Run fzf with choices as input
-        process = subprocess.Popen(
-            fzf_cmd,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-
-        # Send choices to fzf
-        output, error = process.communicate(input="\n".join(choices))
+        # Large lists go through a temp file, mid-sized ones stream from a writer thread
+        if len(choices) > FZF_TEMPFILE_THRESHOLD:
+            returncode, output = _run_fzf_from_file(fzf_cmd, choices)
+        elif len(choices) > FZF_STREAM_THRESHOLD:
+            returncode, output = _run_fzf_piped(fzf_cmd, choices)
+        else:
+            returncode, output = _run_fzf_input(fzf_cmd, choices)
 
         # Return selected choice (strip newline)
-        if process.returncode == 0 and output:
+        if returncode == 0 and output:
             return output.strip()
         return None
 
     except FileNotFoundError:
-        console.print("[red]Error: fzf not found. Please install fzf first.[/red]")
-        console.print("[yellow]  macOS: brew install fzf[/yellow]")
-        console.print("[yellow]  Linux: sudo apt install fzf[/yellow]")
-        console.print("[yellow]  Windows: scoop install fzf[/yellow]")
+        _print_fzf_missing()
         return None
     except Exception as e:
-        console.print(f"[red]fzf error: {e}[/red]")
+        cprint(f"fzf error: {e}", "red")
         return None
 
 
+def fzf_select_stream(
+    producer_cmd: list[str],
+    prompt: str = "",
+    preview: Optional[str] = None,
+    preview_window: str = "down:40%",
+    delimiter: Optional[str] = None,
+) -> tuple[int, Optional[str]]:
+    """
+    Pipe producer_cmd's stdout straight into fzf so it ranks lines as they arrive
+
+    Nothing is buffered in Python. Like fzf_select's skip_single, a lone line
+    is picked without showing fzf (--select-1), and empty output exits with
+    code 1 (--exit-0). The producer gets no stdin, so it can't take keystrokes
+    meant for fzf.
+
+    fzf also exits 1 when the user accepts a query that matches nothing; the
+    printed query tells the two apart, and that case returns (0, None) like
+    any other empty pick.
+
+    Returns: (fzf exit code, selected line or None); code 1 means the producer
+    listed nothing
+    Raises: subprocess.CalledProcessError with the producer's stderr if it
+    failed and nothing was selected
+    """
+    fzf_cmd = _fzf_command(prompt, preview, preview_window, delimiter) + ["--select-1", "--exit-0", "--print-query"]
+
+    with tempfile.TemporaryFile() as errors:
+        producer = subprocess.Popen(
+            producer_cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=errors
+        )
+        try:
+            process = subprocess.Popen(fzf_cmd, stdin=producer.stdout, stdout=subprocess.PIPE)
+            producer.stdout.close()  # fzf holds the only read end, so the producer sees EPIPE once it exits
+            output = process.communicate()[0].decode()
+        except FileNotFoundError:
+            producer.terminate()
+            producer.wait()
+            _print_fzf_missing()
+            return 2, None
+
+        # After --exit-0 the producer has closed its output and is about to
+        # exit; give it a moment so its status isn't lost to terminate()
+        try:
+            producer.wait(timeout=1 if process.returncode == 1 else 0)
+        except subprocess.TimeoutExpired:
+            producer.terminate()
+            producer.wait()
+
+        query, _, selected = output.partition("\n")
+        selected = selected.rstrip("\n")
+        if process.returncode == 0 and selected:
+            return 0, selected
+        if producer.returncode > 0:
+            errors.seek(0)
+            stderr = errors.read().decode(errors="replace")
+            raise subprocess.CalledProcessError(producer.returncode, producer_cmd, stderr=stderr)
+    # With an empty query every line matches, so exit 1 after a query means no match
+    if process.returncode == 1 and query:
+        return 0, None
+    return process.returncode, None
+
+
+@functools.cache
 def is_wsl() -> bool:
     """Check if running inside WSL"""
-    if platform.system() != "Linux":
+    if SYSTEM != "Linux":
+        return False
+    try:
+        with open("/proc/version", "r") as f:
+            return "microsoft" in f.read().lower()
+    except OSError:
         return False
-    with open("/proc/version", "r") as f:
-        return "microsoft" in f.read().lower()
 
 
+@functools.cache
 def get_code_command() -> str:
     """Get the appropriate code command for current platform"""
-    if platform.system() == "Windows":
-        possible_paths = [
-            Path(os.environ.get("LOCALAPPDATA", ""))
-            / "Programs"
-            / "Microsoft VS Code"
-            / "bin"
-            / "code.cmd",
-            Path(os.environ.get("ProgramFiles", ""))
-            / "Microsoft VS Code"
-            / "bin"
-            / "code.cmd",
-        ]
-        for path in possible_paths:
-            if path.exists():
-                return str(path)
-        return "code.cmd"
+    if SYSTEM == "Windows":
+        # A previously resolved path is trusted as long as it still exists
+        try:
+            cached = CODE_PATH_CACHE.read_text().strip()
+            if cached and Path(cached).is_file():
+                return cached
+        except OSError:
+            pass
+
+        # PATH lookup first; the install-location probes below are only a fallback
+        found = shutil.which("code.cmd") or shutil.which("code")
+        if not found:
+            possible_paths = [
+                Path(os.environ.get("LOCALAPPDATA", ""))
+                / "Programs"
+                / "Microsoft VS Code"
+                / "bin"
+                / "code.cmd",
+                Path(os.environ.get("ProgramFiles", ""))
+                / "Microsoft VS Code"
+                / "bin"
+                / "code.cmd",
+            ]
+            found = next((str(path) for path in possible_paths if path.exists()), None)
+        if not found:
+            return "code.cmd"
+
+        try:
+            CODE_PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            CODE_PATH_CACHE.write_text(found)
+        except OSError:
+            pass
+        return found
 
     if is_wsl():
         return "wsl"
@@ -319,24 +812,40 @@ def get_code_command() -> str:
     return "code"
 
 
-def run_vscode(args: list[str]):
-    """Run VSCode with given arguments, handling WSL specially"""
+def run_vscode(args: list[str], env: Optional[dict[str, str]] = None):
+    """
+    Launch VSCode with given arguments, handling WSL specially
+
+    The launcher is detached rather than waited on, so this script exits as
+    soon as VSCode is started. env replaces the inherited environment when given.
+    """
     code_cmd = get_code_command()
-    if code_cmd == "wsl":
-        subprocess.run(["cmd.exe", "/c", "code"] + args)
+    argv = ["cmd.exe", "/c", "code"] + args if code_cmd == "wsl" else [code_cmd] + args
+
+    if SYSTEM == "Windows":
+        detach = {"creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP}
     else:
-        subprocess.run([code_cmd] + args)
+        detach = {"start_new_session": True}
+
+    subprocess.Popen(
+        argv,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env=env,
+        **detach,
+    )
 
 
 def open_vscode_local(path: str):
     """Open VSCode locally"""
-    console.print(f"[cyan]Opening {path} in VSCode...[/cyan]")
+    cprint(f"Opening {path} in VSCode...", "cyan")
     run_vscode([path])
 
 
 def open_vscode_ssh(host: str, path: str):
     """Open VSCode in SSH Remote mode"""
-    console.print(f"[cyan]Opening {path} on {host} in VSCode SSH Remote...[/cyan]")
+    cprint(f"Opening {path} on {host} in VSCode SSH Remote...", "cyan")
     run_vscode(["--remote", f"ssh-remote+{host}", path])
 
 
@@ -344,45 +853,37 @@ def open_vscode_devcontainer(host: str, workspace_path: str, workspace_name: str
     """Open VSCode in DevContainer mode"""
     is_local = is_local_host(host)
     location = "local" if is_local else host
-    console.print(f"[cyan]Opening {workspace_path} on {location} in DevContainer...[/cyan]")
+    cprint(f"Opening {workspace_path} on {location} in DevContainer...", "cyan")
 
     # Search for running container
     containers = list_containers(host, workspace_name)
 
     if containers:
         container = containers[0]
-        console.print(f"[green]Found running container: {container['name']}[/green]")
-        console.print(f"[dim]Image: {container['image'][:60]}...[/dim]")
+        cprint(f"Found running container: {container['name']}", "green")
+        cprint(f"Image: {container['image'][:60]}...", "dim")
 
         # Encode container configuration to hex
-        container_config = f'{{"containerName":"/{container["name"]}"}}'
-        hex_config = container_config.encode().hex()
+        hex_config = ATTACHED_CONTAINER_CONFIG.format(name=container["name"]).encode("utf-8").hex()
 
         # Get workspaceFolder from devcontainer.json (or use default)
         container_path = get_workspace_folder(host, workspace_path, workspace_name)
 
         uri = f"vscode-remote://attached-container+{hex_config}{container_path}"
 
+        # Point only the launched VSCode at the remote Docker daemon
+        env = os.environ.copy()
         if not is_local:
-            os.environ["DOCKER_HOST"] = f"ssh://{host}"
-
-        run_vscode(["--folder-uri", uri])
+            env["DOCKER_HOST"] = f"ssh://{host}"
 
-        if "DOCKER_HOST" in os.environ:
-            del os.environ["DOCKER_HOST"]
+        run_vscode(["--folder-uri", uri], env=env)
     else:
-        console.print(
-            f"[yellow]No running container found for {workspace_name}[/yellow]"
-        )
+        cprint(f"No running container found for {workspace_name}", "yellow")
         if is_local:
-            console.print(
-                "[dim]Opening locally (VSCode will prompt to 'Reopen in Container')...[/dim]"
-            )
+            cprint("Opening locally (VSCode will prompt to 'Reopen in Container')...", "dim")
             open_vscode_local(workspace_path)
         else:
-            console.print(
-                "[dim]Opening in SSH Remote (VSCode will prompt to 'Reopen in Container')...[/dim]"
-            )
+            cprint("Opening in SSH Remote (VSCode will prompt to 'Reopen in Container')...", "dim")
             open_vscode_ssh(host, workspace_path)
 
 
@@ -393,32 +894,32 @@ def open_terminal(host: str, workspace_name: str, user: str = "vscode"):
     containers = list_containers(host, workspace_name)
 
     if not containers:
-        console.print(
-            f"[red]No running containers matching '{workspace_name}' found {location}[/red]"
-        )
+        cprint(f"No running containers matching '{workspace_name}' found {location}", "red")
         return
 
     # Auto-select if only one container matches
     if len(containers) == 1:
         container = containers[0]
-        console.print(f"[green]Found container: {container['name']}[/green]")
+        cprint(f"Found container: {container['name']}", "green")
     else:
         # Multiple containers found, let user select
-        console.print(f"[yellow]Found {len(containers)} containers matching '{workspace_name}'[/yellow]")
-        choices = [f"{c['name']} ({c['image'][:40]}...)" for c in containers]
+        cprint(f"Found {len(containers)} containers matching '{workspace_name}'", "yellow")
+        # Hidden leading index field maps the selection straight back to its container
+        choices = [f"{i}\t{c['name']} ({c['image'][:40]}...)" for i, c in enumerate(containers)]
 
-        selected = fzf_select(choices, prompt="Select container to connect")
+        selected = fzf_select(choices, prompt="Select container to connect", delimiter="\t")
 
         if not selected:
-            console.print("[yellow]No container selected[/yellow]")
+            cprint("No container selected", "yellow")
             return
 
-        idx = choices.index(selected)
-        container = containers[idx]
+        try:
+            container = containers[int(selected.split("\t", 1)[0])]
+        except (ValueError, IndexError):
+            cprint(f"Unrecognized selection: {selected}", "red")
+            return
 
-    console.print(
-        f"[cyan]Connecting to container {container['id']} {location}...[/cyan]"
-    )
+    cprint(f"Connecting to container {container['id']} {location}...", "cyan")
 
     # Connect to container
     # Resolve TERM/COLORTERM in Python to avoid shell expansion issues (e.g. PowerShell treats $TERM as its own variable)
@@ -426,17 +927,44 @@ def open_terminal(host: str, workspace_name: str, user: str = "vscode"):
     colorterm = os.environ.get("COLORTERM", "truecolor")
     exec_cmd = f"docker exec -it -e TERM={term} -e COLORTERM={colorterm} -u {user} {container['id']} zsh -c 'source ~/.zshrc; tmux attach || tmux new'"
 
-    if is_local:
-        subprocess.run(exec_cmd, shell=True)
-    elif platform.system() == "Windows":
-        # Use PowerShell SSH
-        cmd = f"ssh -t {host} \"{exec_cmd}\""
-        subprocess.run(["powershell", "-Command", cmd])
+    # On POSIX the session replaces this process, so the interpreter doesn't
+    # linger for its whole lifetime. Windows has no real exec, so it keeps run().
+    if SYSTEM == "Windows":
+        if is_local:
+            subprocess.run(exec_cmd, shell=True)
+        else:
+            # Use PowerShell SSH
+            cmd = f"ssh -t {host} \"{exec_cmd}\""
+            subprocess.run(["powershell", "-Command", cmd])
+    elif is_local:
+        os.execvp("sh", ["sh", "-c", exec_cmd])
     else:
-        subprocess.run(["ssh", "-t", host, exec_cmd])
+        ensure_ssh_dir()
+        os.execvp("ssh", ["ssh", *SSH_MUX_OPTS, "-t", host, exec_cmd])
+
+
+def remote_workspace_preview(host: str) -> str:
+    """
+    fzf preview for remote "1|0<TAB>path" workspace lines
+
+    The devcontainer flag comes from the listing as {1}, so each highlight costs
+    a single ssh (multiplexed where supported) that only runs ls on {2..}.
+    """
+    if SYSTEM == "Windows":
+        # cmd.exe: findstr tolerates {1} arriving quoted; & runs ls regardless
+        return (
+            "echo {1} | findstr 1 >nul && echo [DevContainer:Yes] || echo [DevContainer:No]"
+            f" & ssh {host} ls -lah {{2..}}"
+        )
+    # ssh re-joins its arguments for the remote shell, so the path travels on
+    # stdin instead and spaces or quotes in it survive intact
+    remote_ls = shlex.quote('IFS= read -r p; ls -lah -- "$p"')
+    return (
+        "[ {1} = 1 ] && echo '✓ DevContainer available' || echo '✗ No DevContainer';"
+        f" echo && printf '%s\\n' {{2..}} | {shlex.join(['ssh', *SSH_MUX_OPTS, host])} {remote_ls}"
+    )
 
 
-@app.command()
 def main(
     host: Annotated[
         Optional[str],
@@ -466,8 +994,16 @@ def main(
         bool,
         typer.Option("--git-only/--no-git-only", help="Only show directories containing .git"),
     ] = True,
+    no_cache: Annotated[
+        bool,
+        typer.Option("--no-cache", help="Refresh remote directory and container listings"),
+    ] = False,
 ):
     """Open remote workspaces in VSCode via SSH Remote or DevContainer."""
+    global LISTING_CACHE_TTL
+    if no_cache:
+        LISTING_CACHE_TTL = 0.0
+
     # Step 0: Select host if not provided
     selected_host = host
 
@@ -477,103 +1013,161 @@ def main(
             hosts = ["local"] + parse_ssh_config()
 
             if len(hosts) == 1:  # Only "local" available
-                console.print("[yellow]No remote hosts found in ~/.ssh/config[/yellow]")
+                cprint("No remote hosts found in ~/.ssh/config", "yellow")
 
             selected_host = fzf_select(hosts, prompt="Select host (local or SSH)")
 
             if not selected_host:
-                console.print("[yellow]No host selected[/yellow]")
+                cprint("No host selected", "yellow")
                 raise typer.Exit(0)
 
             selected_host = selected_host.strip()
         else:
-            console.print(
-                "[red]Error: --host is required in non-interactive mode[/red]"
-            )
+            cprint("Error: --host is required in non-interactive mode", "red")
             raise typer.Exit(1)
 
     is_local = is_local_host(selected_host)
 
-    # Auto-detect base_path if not provided
+    # Interactive remote picks without --filter stream the remote listing
+    # straight into fzf; the list never needs to exist in Python
+    stream_dirs = (
+        not is_local and not path and filter_pattern == "." and SYSTEM != "Windows" and is_interactive()
+    )
+
+    workspace_path = path
+    location = "local" if is_local else selected_host
+
+    # A streamed listing expands $HOME remotely. It runs ssh in batch mode so
+    # no prompt competes with fzf for the terminal; if the host needs one
+    # (unknown key, password), the buffered path below connects interactively.
+    if stream_dirs:
+        cprint(f"📁 Selecting workspace on {location}...", "cyan")
+
+        base_path_expr = shlex.quote(base_path) if base_path else '"$HOME/workspaces"'
+
+        ensure_ssh_dir()
+        try:
+            returncode, selected = fzf_select_stream(
+                [
+                    "ssh", *SSH_MUX_OPTS, "-o", "BatchMode=yes", selected_host,
+                    _remote_listing_cmd(base_path_expr, depth, git_only),
+                ],
+                prompt=f"Select workspace on {location}",
+                preview=remote_workspace_preview(selected_host),
+                preview_window="down:40%",
+                delimiter="\t",
+            )
+        except subprocess.CalledProcessError as e:
+            if e.returncode != 255:
+                cprint(f"Failed to list workspaces on {location}: {e.stderr.strip()}", "red")
+                raise typer.Exit(1)
+            # ssh itself failed; retry with prompts allowed and no fzf on screen
+            if e.stderr.strip():
+                cprint(e.stderr.strip(), "dim")
+            cprint(f"Connecting to {selected_host} interactively...", "dim")
+        else:
+            if returncode == 1:
+                cprint(f"No directories found in {base_path or '~/workspaces'} on {location}", "red")
+                raise typer.Exit(1)
+            if not selected:
+                cprint("No workspace selected", "yellow")
+                raise typer.Exit(0)
+
+            workspace_path = _parse_remote_listing(selected_host, selected)[0]
+
+    # Auto-detect base_path if not provided. On a remote host the workspace
+    # listing rides along with $HOME detection, and is skipped entirely when
+    # a path is already known.
     resolved_base_path = base_path
+    dirs = None
+    # Remote listings apply --filter on the host; main re-checks it below either way
+    remote_filter = "" if filter_pattern == "." else filter_pattern
     if not resolved_base_path:
         if is_local:
             resolved_base_path = f"{Path.home()}/workspaces"
-            console.print(f"[dim]Using base path: {resolved_base_path}[/dim]")
-        else:
-            console.print(f"[dim]Auto-detecting base path on {selected_host}...[/dim]")
-            remote_home, exit_code = ssh_exec(selected_host, "echo $HOME")
-            if exit_code == 0 and remote_home.strip():
-                resolved_base_path = f"{remote_home.strip()}/workspaces"
-                console.print(f"[dim]Using base path: {resolved_base_path}[/dim]")
-            else:
-                console.print(f"[red]Failed to detect home directory on {selected_host}[/red]")
+            cprint(f"Using base path: {resolved_base_path}", "dim")
+        elif not workspace_path:
+            cprint(f"Auto-detecting base path on {selected_host}...", "dim")
+            listing = list_remote_home_workspaces(
+                selected_host, maxdepth=depth, git_only=git_only, filter_pattern=remote_filter
+            )
+            if listing is None:
+                cprint(f"Failed to detect home directory on {selected_host}", "red")
                 raise typer.Exit(1)
+            resolved_base_path, dirs = listing
+            cprint(f"Using base path: {resolved_base_path}", "dim")
 
     # Step 1: Select workspace if not provided
-    workspace_path = path
-    location = "local" if is_local else selected_host
-
     if not workspace_path:
-        console.print(f"[cyan]📁 Selecting workspace on {location}...[/cyan]")
+        cprint(f"📁 Selecting workspace on {location}...", "cyan")
 
-        dirs = list_directories(selected_host, resolved_base_path, maxdepth=depth, git_only=git_only)
+        if dirs is None:
+            dirs = list_directories(
+                selected_host, resolved_base_path, maxdepth=depth, git_only=git_only, filter_pattern=remote_filter
+            )
 
         if filter_pattern != ".":
-            dirs = [d for d in dirs if filter_pattern.lower() in d.lower()]
+            pattern = filter_pattern.lower()
+            dirs = [d for d in dirs if pattern in d.lower()]
 
         if not dirs:
-            console.print(f"[red]No directories found in {resolved_base_path} on {location}[/red]")
+            cprint(f"No directories found in {resolved_base_path} on {location}", "red")
             raise typer.Exit(1)
 
         # If only one match and mode is specified, auto-select it
         if len(dirs) == 1 and mode:
             workspace_path = dirs[0]
-            console.print(f"[green]Auto-selected: {workspace_path}[/green]")
+            cprint(f"Auto-selected: {workspace_path}", "green")
         # If not interactive, require exact path or single match
         elif not is_interactive():
             if len(dirs) == 1:
                 workspace_path = dirs[0]
-                console.print(f"[green]Auto-selected: {workspace_path}[/green]")
+                cprint(f"Auto-selected: {workspace_path}", "green")
             else:
-                console.print(
-                    "[red]Error: Multiple matches found in non-interactive mode[/red]"
-                )
-                console.print(
-                    f"[yellow]Found {len(dirs)} directories matching '{filter_pattern}':[/yellow]"
-                )
+                cprint("Error: Multiple matches found in non-interactive mode", "red")
+                cprint(f"Found {len(dirs)} directories matching '{filter_pattern}':", "yellow")
                 for d in dirs:
-                    console.print(f"  - {d}")
-                console.print(
-                    "\n[yellow]Please specify --path or use a more specific --filter[/yellow]"
-                )
+                    cprint(f"  - {d}")
+                cprint("\nPlease specify --path or use a more specific --filter", "yellow")
                 raise typer.Exit(1)
         else:
             # Interactive selection - show list immediately without pre-checking
             # devcontainer check happens in fzf preview (lazy evaluation)
             if is_local:
+                choices = dirs
+                delimiter = None
                 preview_cmd = "if [ -d {}/.devcontainer ] || [ -f {}/.devcontainer.json ]; then echo '✓ DevContainer available'; else echo '✗ No DevContainer'; fi && echo && ls -lah {}"
-            elif platform.system() == "Windows":
-                # Show devcontainer status first, then always show ls (use & instead of &&)
-                preview_cmd = f"ssh {selected_host} test -d {{}}/.devcontainer && echo [DevContainer:Yes] || echo [DevContainer:No] & ssh {selected_host} ls -lah {{}}"
             else:
-                preview_cmd = f"ssh {selected_host} 'if [ -d {{}}/.devcontainer ] || [ -f {{}}/.devcontainer.json ]; then echo \"✓ DevContainer available\"; else echo \"✗ No DevContainer\"; fi && echo && ls -lah {{}}'"
+                # Same "1|0<TAB>path" lines the streamed listing feeds fzf
+                choices = [f"{int(DEVCONTAINER_FLAGS.get((selected_host, d), False))}\t{d}" for d in dirs]
+                delimiter = "\t"
+                preview_cmd = remote_workspace_preview(selected_host)
 
             selected = fzf_select(
-                dirs,
+                choices,
                 prompt=f"Select workspace on {location}",
                 preview=preview_cmd,
                 preview_window="down:40%",
+                delimiter=delimiter,
             )
 
             if not selected:
-                console.print("[yellow]No workspace selected[/yellow]")
+                cprint("No workspace selected", "yellow")
                 raise typer.Exit(0)
 
-            workspace_path = selected.strip()
+            workspace_path = selected.split("\t", 1)[-1].strip()
 
     workspace_name = Path(workspace_path).name
 
+    # Devcontainer flag, config and containers for every later step, in one
+    # round-trip. It runs in the background while the mode picker is up; only
+    # the flag is needed before that, and the listing usually recorded it.
+    probe = None
+    if not is_local and mode in (None, Mode.devcontainer, Mode.terminal):
+        probe = probe_remote_in_background(selected_host, workspace_path)
+        if (selected_host, workspace_path) not in DEVCONTAINER_FLAGS:
+            probe.result()
+
     # Step 2: Select mode if not provided
     selected_mode = mode.value if mode else None
 
@@ -597,11 +1191,14 @@ def main(
         )
 
         if not selected:
-            console.print("[yellow]No mode selected[/yellow]")
+            cprint("No mode selected", "yellow")
             raise typer.Exit(0)
 
         selected_mode = selected.split("\t")[0]
 
+    if probe and selected_mode in ("devcontainer", "terminal"):
+        probe.result()
+
     # Step 3: Execute based on mode
     if selected_mode == "devcontainer":
         open_vscode_devcontainer(selected_host, workspace_path, workspace_name)
@@ -613,5 +1210,56 @@ def main(
         open_terminal(selected_host, workspace_name)
 
 
+# Option spellings understood by _fast_path_args, mapped to main()'s parameters
+FAST_PATH_OPTIONS = {
+    "--host": "host", "-H": "host",
+    "--path": "path", "-p": "path",
+    "--mode": "mode", "-m": "mode",
+}
+
+
+def _fast_path_args(argv: list[str]) -> Optional[dict]:
+    """
+    Parse the fully specified `--host X --path Y --mode Z` invocation without typer
+
+    Returns main() keyword arguments, or None for anything else (other options,
+    --help, repeats, a missing or empty value or an unknown mode) so typer handles it.
+    """
+    args = {}
+    remaining = iter(argv)
+    for arg in remaining:
+        name, eq, value = arg.partition("=") if arg.startswith("--") else (arg, "", "")
+        param = FAST_PATH_OPTIONS.get(name)
+        if param is None or param in args:
+            return None
+        if not eq:
+            value = next(remaining, None)
+        # main() treats an empty value as missing and may prompt or raise typer.Exit
+        if not value:
+            return None
+        args[param] = value
+
+    if len(args) != len(set(FAST_PATH_OPTIONS.values())):
+        return None
+    try:
+        args["mode"] = Mode(args["mode"])
+    except ValueError:
+        return None
+    return args
+
+
 if __name__ == "__main__":
-    app()
+    fast_args = _fast_path_args(sys.argv[1:])
+    if fast_args is not None:
+        # With all three values non-empty nothing on this path prompts or exits early,
+        # so typer is never imported
+        main(**fast_args)
+    else:
+        import typer
+
+        app = typer.Typer(
+            help="VSCode Remote Access Tool - Open remote workspaces via SSH Remote or DevContainer",
+            no_args_is_help=False,
+        )
+        app.command()(main)
+        app()